@@ -13,6 +13,15 @@ Usage example:
 
 This script prints a single JSON line to stdout with fields:
   {"out_path": "...", "duration_sec": <float>, "sr": <int>}
+
+Worker mode:
+  python scripts/chatterbox_tts.py --serve --speaker-wav /path/to/voice.wav
+
+  In --serve mode the model is loaded once, then the script reads one JSON
+  request per line from stdin ({"text": ..., "out": ..., "speaker_wav": ...})
+  and writes one JSON response line to stdout per request. This amortizes the
+  multi-second model load across many synthesis calls instead of paying it on
+  every CLI invocation.
 """
 from __future__ import annotations
 
@@ -69,231 +78,522 @@ def _clean_sys_path_and_env(verbose: bool = False) -> None:
         print(f"[chatterbox] Cleaned sys.path; Numba cache: {cache_dir}", file=sys.stderr)
 
 
-def main(argv: list[str] | None = None) -> int:
-    parser = argparse.ArgumentParser(description="Chatterbox TTS CLI")
-    parser.add_argument("--text", required=True, help="Text to synthesize")
-    parser.add_argument("--out", required=True, type=Path, help="Output WAV path")
-    parser.add_argument("--speaker-wav", dest="speaker_wav", type=Path, help="Reference voice WAV path for cloning")
-    parser.add_argument("--device", default="cpu", help="torch device: cpu or cuda")
-    parser.add_argument("--language", default="en", help="Language id for multilingual model (e.g. en, fr, zh)")
-    parser.add_argument("--multilingual", action="store_true", help="Use multilingual model")
-    parser.add_argument("--exaggeration", type=float, default=0.5, help="Emotion/exaggeration control (0..1)")
-    parser.add_argument("--cfg-weight", dest="cfg_weight", type=float, default=0.5, help="Guidance weight (0..1)")
-    parser.add_argument(
-        "--steps",
-        type=int,
-        default=int(os.environ.get("CHATTERBOX_STEPS", "50")),
-        help="Number of inference steps for model.generate() if supported (CPU-friendly default)",
-    )
-    parser.add_argument(
-        "--attn-impl",
-        dest="attn_impl",
-        default=os.environ.get("CHATTERBOX_ATTN_IMPL"),
-        help="Attention implementation hint for model.generate() or model (e.g., 'eager') if supported",
-    )
-    parser.add_argument(
-        "--max-new-tokens",
-        dest="max_new_tokens",
-        type=int,
-        default=int(os.environ.get("CHATTERBOX_MAX_NEW_TOKENS", "64")),
-        help="Limit LLM token generation if model.generate() accepts it (e.g., max_new_tokens)",
-    )
-    parser.add_argument("--verbose", action="store_true", help="Enable debug logging")
+_KWARGS_CACHE_PATH = Path.home() / ".cache" / "famflix" / "chatterbox_kwargs.json"
 
-    args = parser.parse_args(argv)
+# Candidate kwarg names, ordered by likelihood; tuples preserve the probe order
+# and the derived frozensets make membership checks O(1)
+PATH_CANDIDATES = (
+    "speaker_wav",
+    "audio_prompt_path",
+    "prompt_path",
+    "voice_prompt_path",
+    "reference_audio_path",
+    "speaker_wav_path",
+    "audio_prompt",
+    "voice_prompt",
+    "reference_audio",
+    "prompt",
+    "speaker_audio",
+)
+TENSOR_CANDIDATES = (
+    "speaker_wav",
+    "audio_prompt",
+    "voice_prompt",
+    "reference_audio",
+    "prompt",
+    "speaker_audio",
+)
+STEP_PARAM_CANDIDATES = (
+    "num_inference_steps",
+    "steps",
+    "n_steps",
+    "inference_steps",
+    "num_steps",
+    "num_sampling_steps",
+    "n_inference_steps",
+    "num_iters",
+    "n_iters",
+    "iterations",
+)
+TOKEN_PARAM_CANDIDATES = (
+    "max_new_tokens",
+    "max_length",
+    "new_tokens",
+    "tokens",
+)
 
-    if args.verbose:
-        logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s", stream=sys.stderr)
-        _clean_sys_path_and_env(verbose=True)
-    else:
-        _clean_sys_path_and_env()
+# generate() signature cache keyed by the id of the underlying function, so all
+# instances of a model class share one introspection
+_SIG_CACHE: dict[int, tuple[set, bool]] = {}
 
-    torch = None
-    ta = None
 
-    # Lightweight fallback: if heavy deps are missing, synthesize a simple beep WAV so dev can proceed
+def get_generate_signature(model: Any) -> tuple[set, bool]:
+    """Return (param_names, has_var_kw) for model.generate, memoized per function."""
+    fn = getattr(type(model), "generate", None) or model.generate
+    key = id(fn)
+    cached = _SIG_CACHE.get(key)
+    if cached is not None:
+        return cached
+    sig = inspect.signature(model.generate)
+    param_names = set(sig.parameters.keys())
+    has_var_kw = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values())
+    _SIG_CACHE[key] = (param_names, has_var_kw)
+    return param_names, has_var_kw
+
+
+def _model_cache_key(model: Any) -> str:
+    """Cache key for the resolved prompt kwarg: model class plus chatterbox version."""
+    cls = type(model)
     try:
-        import torch
-        import torchaudio as ta
-        import torchaudio.functional as TAF
-        from chatterbox.tts import ChatterboxTTS
-        if args.multilingual:
-            from chatterbox.mtl_tts import ChatterboxMultilingualTTS  # type: ignore
-    except Exception as exc:
-        # Fallback: produce a short sine beep WAV using only stdlib
-        try:
-            sr = 22050
-            text_len = max(1, len(args.text.strip()))
-            # rough heuristic: 0.02s per char, clamped 1.5..12s
-            duration = max(1.5, min(12.0, 0.02 * text_len))
-            freq = 440.0
-            frames = int(sr * duration)
-            args.out.parent.mkdir(parents=True, exist_ok=True)
-            with wave.open(str(args.out), 'w') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)  # 16-bit
-                wf.setframerate(sr)
-                for i in range(frames):
-                    # fade in/out to avoid clicks
-                    t = i / sr
-                    amp = 0.2
-                    if i < sr * 0.05:
-                        amp *= (i / (sr * 0.05))
-                    if i > frames - sr * 0.05:
-                        amp *= max(0.0, (frames - i) / (sr * 0.05))
-                    sample = int(max(-1.0, min(1.0, amp * math.sin(2 * math.pi * freq * t))) * 32767)
-                    wf.writeframes(struct.pack('<h', sample))
-            print(json.dumps({
-                "out_path": str(args.out),
-                "duration_sec": duration,
-                "sr": sr,
-                "used_prompt_arg": None,
-                "normalized_prompt_path": None,
-                "note": "fallback_beep_audio"
-            }), flush=True)
-            return 0
-        except Exception as e:
-            print(json.dumps({
-                "error": f"Missing dependencies: {exc}. Install with: pip install chatterbox-tts torch torchaudio. Fallback failed: {e}"
-            }), file=sys.stdout, flush=True)
-            return 2
+        import chatterbox  # type: ignore
+        version = getattr(chatterbox, "__version__", "unknown")
+    except Exception:
+        version = "unknown"
+    return f"{cls.__module__}.{cls.__qualname__}@{version}"
 
-    device = args.device
+
+def load_prompt_arg_cache(model: Any) -> tuple[str, str] | None:
+    """Return the (kwarg, kind) that worked for this model class on a previous run."""
     try:
-        if device.startswith("cuda") and not torch.cuda.is_available():
-            device = "cpu"
-            if args.verbose:
-                logging.info("Fallback to CPU: CUDA unavailable")
+        data = json.loads(_KWARGS_CACHE_PATH.read_text(encoding="utf-8"))
+        entry = data.get(_model_cache_key(model))
+        if entry and entry.get("prompt_arg"):
+            return (str(entry["prompt_arg"]), str(entry.get("kind", "path")))
     except Exception:
-        device = "cpu"
+        pass
+    return None
+
 
-    # CPU thread tuning for better predictability on CPU
+def save_prompt_arg_cache(model: Any, prompt_arg: str, kind: str) -> None:
+    """Persist the winning prompt kwarg so later invocations skip the candidate sweep."""
     try:
-        import os as _os
-        _nt = int(_os.environ.get("TORCH_NUM_THREADS", "2"))
-        _it = int(_os.environ.get("TORCH_NUM_INTEROP_THREADS", "1"))
-        torch.set_num_threads(_nt)
-        torch.set_num_interop_threads(_it)
-        if args.verbose:
-            logging.debug(f"Set Torch threads: num={_nt}, interop={_it}")
-    except (ValueError, AttributeError) as e:
-        if args.verbose:
-            logging.warning(f"Thread tuning failed: {e}")
+        data = {}
+        if _KWARGS_CACHE_PATH.exists():
+            data = json.loads(_KWARGS_CACHE_PATH.read_text(encoding="utf-8"))
+        data[_model_cache_key(model)] = {"cls": _model_cache_key(model), "prompt_arg": prompt_arg, "kind": kind}
+        _KWARGS_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        _KWARGS_CACHE_PATH.write_text(json.dumps(data), encoding="utf-8")
+    except Exception:
+        pass
 
-    # Load model, passing attention implementation to from_pretrained if supported
-    pretrained_kwargs = {}
-    if args.attn_impl:
+
+def write_beep_wav(out_path: Path, text: str, sr: int = 22050) -> float:
+    """Write a short fade-in/out sine beep WAV using only stdlib; return its duration."""
+    text_len = max(1, len(text.strip()))
+    # rough heuristic: 0.02s per char, clamped 1.5..12s
+    duration = max(1.5, min(12.0, 0.02 * text_len))
+    freq = 440.0
+    frames = int(sr * duration)
+    out_path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(out_path), 'w') as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)  # 16-bit
+        wf.setframerate(sr)
+        for i in range(frames):
+            # fade in/out to avoid clicks
+            t = i / sr
+            amp = 0.2
+            if i < sr * 0.05:
+                amp *= (i / (sr * 0.05))
+            if i > frames - sr * 0.05:
+                amp *= max(0.0, (frames - i) / (sr * 0.05))
+            sample = int(max(-1.0, min(1.0, amp * math.sin(2 * math.pi * freq * t))) * 32767)
+            wf.writeframes(struct.pack('<h', sample))
+    return duration
+
+
+def configure_cpu_threads() -> int:
+    """Pick a thread count from the physical core count and export it to the BLAS env.
+
+    Must run before torch is imported so oneDNN/MKL/OpenMP pick the settings up
+    at init. TORCH_NUM_THREADS still takes precedence as an explicit override.
+    """
+    physical = None
+    try:
+        import psutil  # type: ignore
+        physical = psutil.cpu_count(logical=False)
+    except Exception:
+        pass
+    default_nt = physical or max(1, (os.cpu_count() or 4) - 1)
+    nt = int(os.environ.get("TORCH_NUM_THREADS") or default_nt)
+    os.environ.setdefault("OMP_NUM_THREADS", str(nt))
+    os.environ.setdefault("MKL_NUM_THREADS", str(nt))
+    os.environ.setdefault("OPENBLAS_NUM_THREADS", str(nt))
+    os.environ.setdefault("KMP_AFFINITY", "granularity=fine,compact,1,0")
+    return nt
+
+
+def resolve_autocast_dtype(torch_mod: Any, device: str, precision: str) -> Any | None:
+    """Map the --precision choice to an autocast dtype (None keeps FP32/eager).
+
+    "auto" picks fp16 on CUDA and bf16 on CPUs that advertise the fast paths
+    (AVX-512 BF16/VNNI via oneDNN); otherwise stays in fp32.
+    """
+    if precision == "fp32":
+        return None
+    if device.startswith("cuda"):
+        if precision == "bf16":
+            return torch_mod.bfloat16
+        return torch_mod.float16  # fp16 and auto
+    # CPU autocast only has a fast bf16 path
+    if precision == "bf16":
+        return torch_mod.bfloat16
+    if precision == "auto":
         try:
-            if "attn_implementation" in inspect.signature(ChatterboxTTS.from_pretrained).parameters:
-                pretrained_kwargs["attn_implementation"] = args.attn_impl
+            if torch_mod.cpu._is_cpu_support_vnni():
+                return torch_mod.bfloat16
         except Exception:
             pass
+    return None
+
+
+class _LazyTAF:
+    """Deferred torchaudio.functional: the module is only imported when a
+    resample is actually performed, keeping the common no-prompt startup lean."""
+
+    def __getattr__(self, name: str) -> Any:
+        import torchaudio.functional as TAF  # noqa: N811
+        return getattr(TAF, name)
+
+
+def resample_audio(wav: Any, sr_in: int, sr_out: int, TAF: Any) -> Any:
+    """Resample a waveform, preferring julius' fused single-conv sinc resampler.
 
+    julius.resample_frac is considerably faster than torchaudio's Kaldi-style
+    multi-conv implementation for typical sample-rate ratios; fall back to
+    torchaudio when julius is not installed.
+    """
     try:
-        if args.multilingual:
-            model = ChatterboxMultilingualTTS.from_pretrained(device=device, **pretrained_kwargs)  # type: ignore[name-defined]
-        else:
-            model = ChatterboxTTS.from_pretrained(device=device, **pretrained_kwargs)
-    except TypeError:
-        # Fallback if the extra kwargs are not supported
-        if args.multilingual:
-            model = ChatterboxMultilingualTTS.from_pretrained(device=device)  # type: ignore[name-defined]
-        else:
-            model = ChatterboxTTS.from_pretrained(device=device)
+        import julius  # type: ignore
+        return julius.resample_frac(wav, sr_in, sr_out, rolloff=0.99, zeros=6)
+    except Exception:
+        return TAF.resample(wav, sr_in, sr_out)
 
-    # Try to set attention implementation flag on model/pipeline if present
-    if args.attn_impl:
-        for obj in [model, getattr(model, "pipeline", None), getattr(model, "model", None)]:
-            if obj is not None and hasattr(obj, "attn_implementation"):
-                try:
-                    setattr(obj, "attn_implementation", args.attn_impl)
-                except Exception:
-                    pass
 
-    # Clamp token generation on HF text backends if accessible
-    for obj in [model, getattr(model, "pipeline", None), getattr(model, "model", None), getattr(model, "generator", None)]:
-        if obj is None:
-            continue
-        gen_cfg = getattr(obj, "generation_config", None)
-        if gen_cfg is not None:
+def load_prompt_streaming(path: Path, target_sr: int) -> Any | None:
+    """Decode a reference prompt with torchaudio's ffmpeg StreamReader.
+
+    The mono downmix and resample to the model's rate happen inside ffmpeg in a
+    single pass (soxr), so no stereo buffer or second resample is allocated.
+    Returns a [1, samples] float32 tensor, or None when StreamReader is
+    unavailable or cannot decode the file.
+    """
+    try:
+        from torchaudio.io import StreamReader  # type: ignore
+
+        reader = StreamReader(str(path))
+        reader.add_basic_audio_stream(
+            frames_per_chunk=-1,
+            sample_rate=target_sr,
+            num_channels=1,
+            format="fltp",
+        )
+        reader.process_all_packets()
+        (chunk,) = reader.pop_chunks()
+        if chunk is None:
+            return None
+        # StreamReader yields [frames, channels]; the model expects [channels, frames]
+        return chunk.t().contiguous()
+    except Exception:
+        return None
+
+
+_PREPARE_PROMPT_FN: Any = None
+
+
+def get_prepare_prompt_fn(torch_mod: Any, TAF: Any) -> Any:
+    """Return a (cached) mono-downmix + resample pipeline for the speaker prompt.
+
+    When julius is absent the pipeline is compiled once with torch.jit.script so
+    the mean/resample ops dispatch without per-call Python overhead; when julius
+    is installed its resampler already wins, so the eager path is kept.
+    """
+    global _PREPARE_PROMPT_FN
+    if _PREPARE_PROMPT_FN is not None:
+        return _PREPARE_PROMPT_FN
+
+    def _eager(wav: Any, sr_in: int, target_sr: int) -> Any:
+        if wav.dim() == 2 and wav.size(0) > 1:
+            wav = wav.mean(dim=0, keepdim=True)
+        if sr_in != target_sr:
+            wav = resample_audio(wav, sr_in, target_sr, TAF)
+        return wav
+
+    fn = _eager
+    try:
+        import julius  # noqa: F401  # julius resampler beats a scripted TAF pipeline
+    except Exception:
+        def _scriptable(wav, sr_in: int, target_sr: int):
+            if wav.dim() == 2 and wav.size(0) > 1:
+                wav = wav.mean(dim=0, keepdim=True)
+            if sr_in != target_sr:
+                wav = TAF.resample(wav, sr_in, target_sr)
+            return wav
+
+        try:
+            fn = torch_mod.jit.script(_scriptable)
+        except Exception:
+            fn = _eager
+
+    _PREPARE_PROMPT_FN = fn
+    return fn
+
+
+def maybe_compile_model(model: Any, torch_mod: Any, verbose: bool = False) -> Any:
+    """Best-effort torch.compile of the model (or its inner backbone).
+
+    Compiling the innermost module is preferred because high-level generate()
+    wrappers often contain data-dependent control flow that breaks full-graph
+    compilation. Failures leave the model untouched.
+    """
+    if not hasattr(torch_mod, "compile"):
+        return model
+    for attr in ("model", "transformer", "backbone"):
+        inner = getattr(model, attr, None)
+        if inner is not None and hasattr(inner, "forward") and hasattr(inner, "parameters"):
             try:
-                if hasattr(gen_cfg, "max_new_tokens"):
-                    setattr(gen_cfg, "max_new_tokens", int(max(1, args.max_new_tokens)))
-                if hasattr(gen_cfg, "max_length"):
-                    # Ensure total length is reasonable on CPU
-                    ml = int(max(8, args.max_new_tokens + 16))
-                    setattr(gen_cfg, "max_length", ml)
+                setattr(model, attr, torch_mod.compile(inner, mode="reduce-overhead", dynamic=True))
+                if verbose:
+                    logging.debug(f"torch.compile applied to model.{attr}")
+                return model
             except Exception:
-                pass
+                continue
+    try:
+        compiled = torch_mod.compile(model, mode="reduce-overhead", dynamic=True)
+        if verbose:
+            logging.debug("torch.compile applied to the full model")
+        return compiled
+    except Exception:
+        return model
 
-    # Try to set default step count on model/pipeline if exposed as attribute
-    for obj in [model, getattr(model, "pipeline", None), getattr(model, "diffusion", None)]:
-        if obj is None:
+
+class _CudaGraphStep:
+    """Wrap a per-step callable and replay it through a captured CUDA graph.
+
+    The wrapper runs a few eager warmup calls, then captures the step once the
+    tensor argument shapes have stabilised. Replays copy new inputs into the
+    static buffers and return clones of the static outputs. Any shape change or
+    capture failure permanently falls back to the eager callable, matching the
+    usual CUDA Graphs dynamic-shape caveats.
+    """
+
+    WARMUP_CALLS = 3
+
+    def __init__(self, fn: Any, torch_mod: Any, verbose: bool = False) -> None:
+        self._fn = fn
+        self._torch = torch_mod
+        self._verbose = verbose
+        self._calls = 0
+        self._shapes: tuple | None = None
+        self._graph = None
+        self._static_args: tuple | None = None
+        self._static_out = None
+        self._disabled = False
+
+    def _signature_of(self, args: tuple) -> tuple:
+        torch = self._torch
+        return tuple(
+            (tuple(a.shape), str(a.dtype)) if isinstance(a, torch.Tensor) else ("scalar", repr(a))
+            for a in args
+        )
+
+    def __call__(self, *args: Any, **kwargs: Any) -> Any:
+        torch = self._torch
+        if self._disabled or kwargs:
+            return self._fn(*args, **kwargs)
+        sig = self._signature_of(args)
+        if self._graph is not None:
+            if sig != self._shapes:
+                self._disabled = True
+                return self._fn(*args)
+            for static, new in zip(self._static_args, args):
+                if isinstance(static, torch.Tensor):
+                    static.copy_(new)
+            self._graph.replay()
+            out = self._static_out
+            return out.clone() if isinstance(out, torch.Tensor) else out
+        if self._shapes is not None and sig != self._shapes:
+            # Shapes are dynamic; capture would fail anyway
+            self._disabled = True
+            return self._fn(*args)
+        self._shapes = sig
+        self._calls += 1
+        if self._calls < self.WARMUP_CALLS:
+            return self._fn(*args)
+        # Attempt capture with static clones of the current arguments
+        try:
+            static_args = tuple(a.clone() if isinstance(a, torch.Tensor) else a for a in args)
+            stream = torch.cuda.Stream()
+            stream.wait_stream(torch.cuda.current_stream())
+            with torch.cuda.stream(stream):
+                self._fn(*static_args)
+            torch.cuda.current_stream().wait_stream(stream)
+            graph = torch.cuda.CUDAGraph()
+            with torch.cuda.graph(graph, stream=stream):
+                self._static_out = self._fn(*static_args)
+            self._graph = graph
+            self._static_args = static_args
+            if self._verbose:
+                logging.debug("CUDA graph captured for decoder step")
+            for static, new in zip(static_args, args):
+                if isinstance(static, torch.Tensor):
+                    static.copy_(new)
+            self._graph.replay()
+            out = self._static_out
+            return out.clone() if isinstance(out, torch.Tensor) else out
+        except Exception as exc:
+            if self._verbose:
+                logging.debug(f"CUDA graph capture failed, staying eager: {exc}")
+            self._disabled = True
+            self._graph = None
+            return self._fn(*args)
+
+
+def try_enable_cuda_graph(model: Any, torch_mod: Any, verbose: bool = False) -> bool:
+    """Wrap the model's inner step callable with CUDA graph replay, if one is found."""
+    candidates = [
+        (getattr(model, "diffusion", None), "step"),
+        (getattr(model, "pipeline", None), "step"),
+        (getattr(model, "model", None), "forward"),
+    ]
+    for obj, attr in candidates:
+        fn = getattr(obj, attr, None) if obj is not None else None
+        if fn is None or not callable(fn):
             continue
-        for key in [
-            "num_inference_steps","steps","n_steps","inference_steps","num_steps",
-            "num_sampling_steps","n_inference_steps","num_iters","n_iters","iterations",
-        ]:
-            if hasattr(obj, key):
-                try:
-                    setattr(obj, key, args.steps)
-                    break
-                except Exception:
-                    pass
+        try:
+            setattr(obj, attr, _CudaGraphStep(fn, torch_mod, verbose=verbose))
+            return True
+        except Exception:
+            continue
+    return False
+
+
+try:
+    import orjson as _orjson  # type: ignore
+
+    def _dumps(obj: dict) -> bytes:
+        return _orjson.dumps(obj)
+except ImportError:
+    def _dumps(obj: dict) -> bytes:
+        return json.dumps(obj).encode()
 
-    # Debug: print effective settings (stderr so stdout remains JSON-only for the pipeline)
-    try:
-        print(f"[chatterbox] device={device} steps={args.steps} attn_impl={args.attn_impl}", file=sys.stderr, flush=True)
-    except Exception:
-        pass
 
+def _emit(payload: dict) -> None:
+    """Write one JSON response line on stdout (stdout stays JSON-only)."""
+    sys.stdout.buffer.write(_dumps(payload) + b"\n")
+    sys.stdout.buffer.flush()
+
+
+def synthesize_request(
+    model: Any,
+    *,
+    text: str,
+    out: Path,
+    speaker_wav: Path | None,
+    args: argparse.Namespace,
+    state: dict,
+    ta: Any,
+    TAF: Any,
+    torch: Any,
+) -> dict:
+    """Synthesize one utterance and persist it as WAV; return the response payload.
+
+    `state` persists across calls (notably in --serve mode) and caches the
+    `inspect.signature(model.generate)` results plus the winning prompt kwarg so
+    repeat requests skip the candidate-key search entirely.
+
+    On failure the payload contains an "error" key and a "code" exit status.
+    """
     # Prepare prompt normalization if provided
     normalized_prompt_path: str | None = None
     prompt_wav = None
     prompt_sr = None
-    if args.speaker_wav:
-        speaker_wav_path = Path(args.speaker_wav)
+
+    # A pre-decoded tensor (see --speaker-tensor) skips the decode+resample
+    # entirely; the WAV path below remains the fallback.
+    tensor_path = getattr(args, "speaker_tensor", None)
+    if tensor_path:
+        tensor_path = Path(tensor_path)
+        cached_prompt = state.get("prompt")
+        if cached_prompt and cached_prompt[0] == str(tensor_path):
+            normalized_prompt_path, prompt_wav, prompt_sr = cached_prompt[1], cached_prompt[2], cached_prompt[3]
+        elif tensor_path.exists():
+            try:
+                payload = torch.load(str(tensor_path), map_location="cpu")
+                prompt_wav = payload["wav"]
+                prompt_sr = int(payload["sr"])
+                model_sr = int(getattr(model, "sr", 0) or 0)
+                if model_sr and prompt_sr != model_sr:
+                    prepare = get_prepare_prompt_fn(torch, TAF)
+                    prompt_wav = prepare(prompt_wav, prompt_sr, model_sr)
+                    prompt_sr = model_sr
+                state["prompt"] = [str(tensor_path), None, prompt_wav, prompt_sr]
+            except Exception:
+                prompt_wav = None
+                prompt_sr = None
+                if args.verbose:
+                    logging.warning(f"Could not load speaker tensor {tensor_path}; falling back to WAV prompt")
+
+    if prompt_wav is None and speaker_wav:
+        speaker_wav_path = Path(speaker_wav)
         if not speaker_wav_path.exists():
-            print(json.dumps({
-                "error": f"Speaker WAV not found: {speaker_wav_path}"
-            }), file=sys.stdout, flush=True)
-            return 3
+            return {"error": f"Speaker WAV not found: {speaker_wav_path}", "code": 3}
 
-        # Load prompt
-        try:
-            wav_in, sr_in = ta.load(str(speaker_wav_path))
-            # Convert to mono if needed
-            if wav_in.dim() == 2 and wav_in.size(0) > 1:
-                wav_in = wav_in.mean(dim=0, keepdim=True)
-            target_sr = int(getattr(model, "sr", sr_in) or sr_in)
-            if int(sr_in) != target_sr:
-                wav_in = TAF.resample(wav_in, int(sr_in), target_sr)
-                sr_in = target_sr
-
-            # Save a normalized WAV next to output
-            out_dir = args.out.parent
-            out_dir.mkdir(parents=True, exist_ok=True)
-            norm_path = out_dir / "prompt_normalized.wav"
-            ta.save(str(norm_path), wav_in, sr_in, format="wav")
-            normalized_prompt_path = str(norm_path)
-            prompt_wav, prompt_sr = wav_in, sr_in
-        except Exception:
-            # If torchaudio cannot decode, fall back to raw path
-            normalized_prompt_path = str(speaker_wav_path)
-            if args.verbose:
-                logging.warning(f"Prompt normalization failed, using raw path: {speaker_wav_path}")
+        # Reuse the prompt from the previous request when it is the same file
+        cached_prompt = state.get("prompt")
+        if cached_prompt and cached_prompt[0] == str(speaker_wav_path):
+            normalized_prompt_path, prompt_wav, prompt_sr = cached_prompt[1], cached_prompt[2], cached_prompt[3]
+        else:
+            # Load prompt into memory; the normalized WAV is only written to disk
+            # if a path-style generate() kwarg ends up being used (see below)
+            try:
+                model_sr = int(getattr(model, "sr", 0) or 0)
+                wav_in = load_prompt_streaming(speaker_wav_path, model_sr) if model_sr else None
+                if wav_in is not None:
+                    prompt_wav, prompt_sr = wav_in, model_sr
+                else:
+                    wav_in, sr_in = ta.load(str(speaker_wav_path))
+                    target_sr = int(getattr(model, "sr", sr_in) or sr_in)
+                    prepare = get_prepare_prompt_fn(torch, TAF)
+                    wav_in = prepare(wav_in, int(sr_in), target_sr)
+                    prompt_wav, prompt_sr = wav_in, target_sr
+            except Exception:
+                # If torchaudio cannot decode, fall back to raw path
+                normalized_prompt_path = str(speaker_wav_path)
+                if args.verbose:
+                    logging.warning(f"Prompt normalization failed, using raw path: {speaker_wav_path}")
+            state["prompt"] = [str(speaker_wav_path), normalized_prompt_path, prompt_wav, prompt_sr]
 
-    # Introspect generate() signature to pass only supported kwargs
-    sig = inspect.signature(model.generate)
-    param_names = set(sig.parameters.keys())
-    has_var_kw = any(p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values())
+    def ensure_prompt_path() -> str | None:
+        """Write the normalized prompt WAV on first use and return its path.
+
+        Skipped entirely when the model accepts the in-memory tensor, which
+        avoids a redundant encode + decode round-trip per request.
+        """
+        nonlocal normalized_prompt_path
+        if normalized_prompt_path is not None:
+            return normalized_prompt_path
+        if prompt_wav is None:
+            return None
+        out_dir = out.parent
+        out_dir.mkdir(parents=True, exist_ok=True)
+        norm_path = out_dir / "prompt_normalized.wav"
+        ta.save(str(norm_path), prompt_wav, prompt_sr, format="wav")
+        normalized_prompt_path = str(norm_path)
+        cached = state.get("prompt")
+        if cached:
+            cached[1] = normalized_prompt_path
+        return normalized_prompt_path
+
+    # Introspect generate() signature to pass only supported kwargs (memoized)
+    param_names, has_var_kw = get_generate_signature(model)
 
     def filter_kwargs(base: dict) -> dict:
         if has_var_kw:
             return {k: v for k, v in base.items() if v is not None}
         return {k: v for k, v in base.items() if (k in param_names) and (v is not None)}
 
-    base_kwargs = {"text": args.text}
+    base_kwargs = {"text": text}
     # Optional controls
     if "exaggeration" in param_names:
         base_kwargs["exaggeration"] = max(0.0, min(1.0, args.exaggeration))
@@ -303,23 +603,7 @@ def main(argv: list[str] | None = None) -> int:
         base_kwargs["language"] = args.language
 
     # Steps mapping to common parameter names
-    step_param_candidates = [
-        "num_inference_steps",
-        "steps",
-        "n_steps",
-        "inference_steps",
-        "num_steps",
-        "num_sampling_steps",
-        "n_inference_steps",
-        "num_iters",
-        "n_iters",
-        "iterations",
-    ]
-    step_key_to_use = None
-    for key in step_param_candidates:
-        if key in param_names:
-            step_key_to_use = key
-            break
+    step_key_to_use = next((k for k in STEP_PARAM_CANDIDATES if k in param_names), None)
     # If generate() accepts **kwargs, pass a sensible default key even if it's not in the signature
     if step_key_to_use is None and has_var_kw:
         step_key_to_use = "num_inference_steps"
@@ -330,13 +614,9 @@ def main(argv: list[str] | None = None) -> int:
         base_kwargs["attn_implementation"] = args.attn_impl
 
     # Token generation limit for internal LLMs
-    token_param_candidates = [
-        "max_new_tokens", "max_length", "new_tokens", "tokens",
-    ]
-    for key in token_param_candidates:
-        if has_var_kw or (key in param_names):
-            base_kwargs[key] = int(max(1, args.max_new_tokens))
-            break
+    token_key = next((k for k in TOKEN_PARAM_CANDIDATES if has_var_kw or k in param_names), None)
+    if token_key is not None:
+        base_kwargs[token_key] = int(max(1, args.max_new_tokens))
 
     base_kwargs = filter_kwargs(base_kwargs)
 
@@ -346,29 +626,12 @@ def main(argv: list[str] | None = None) -> int:
     used_prompt_arg = None
     last_err: Exception | None = None
 
-    # Candidates to try with string path
-    path_candidates = [
-        "speaker_wav",
-        "audio_prompt_path",
-        "prompt_path",
-        "voice_prompt_path",
-        "reference_audio_path",
-        "speaker_wav_path",
-        "audio_prompt",
-        "voice_prompt",
-        "reference_audio",
-        "prompt",
-        "speaker_audio",
-    ]
-    # Candidates to try with waveform tensor
-    tensor_candidates = [
-        "speaker_wav",
-        "audio_prompt",
-        "voice_prompt",
-        "reference_audio",
-        "prompt",
-        "speaker_audio",
-    ]
+    def _amp_ctx():
+        amp = state.get("amp")
+        if not amp or amp[1] is None:
+            import contextlib
+            return contextlib.nullcontext()
+        return torch.autocast(device_type=amp[0], dtype=amp[1])
 
     # Helper to attempt a call
     def try_call(prompt_key: str, value) -> tuple[bool, object | None, Exception | None]:
@@ -377,11 +640,12 @@ def main(argv: list[str] | None = None) -> int:
         if prompt_key in param_names:
             kwargs[prompt_key] = value
         try:
-            out = model.generate(**kwargs)
+            with torch.inference_mode(), _amp_ctx():
+                out_audio = model.generate(**kwargs)
             used_prompt_arg = prompt_key
             if args.verbose:
                 logging.debug(f"Success with prompt_key={prompt_key} (type={type(value)})")
-            return True, out, None
+            return True, out_audio, None
         except TypeError as te:
             if args.verbose:
                 logging.debug(f"TypeError for {prompt_key}: {te}")
@@ -391,34 +655,62 @@ def main(argv: list[str] | None = None) -> int:
                 logging.debug(f"Error for {prompt_key}: {e}")
             return False, None, e
 
-    # 1) Try with path
-    if normalized_prompt_path is not None:
-        for key in path_candidates:
-            if key not in param_names:
-                continue
-            ok, out, err = try_call(key, normalized_prompt_path)
-            tried.append((key, "path"))
+    # 0) Reuse the prompt kwarg that succeeded on a previous request (or, on the
+    # first request of the process, one recorded on disk by an earlier run)
+    cached_key = state.get("used_prompt_arg")
+    if cached_key is None and "disk_cache_checked" not in state:
+        state["disk_cache_checked"] = True
+        cached_key = load_prompt_arg_cache(model)
+        if cached_key and cached_key[0] not in param_names and not has_var_kw:
+            cached_key = None
+    if cached_key:
+        key, kind = cached_key
+        value = ensure_prompt_path() if kind == "path" else prompt_wav
+        if value is not None:
+            ok, out_audio, err = try_call(key, value)
+            tried.append((key, kind))
             if ok:
-                wav = out
-                break
-            last_err = err
+                wav = out_audio
+                state["used_prompt_arg"] = (key, kind)
+            else:
+                last_err = err
+                state.pop("used_prompt_arg", None)
 
-    # 2) Try with tensor if path attempts failed
+    # 1) Try with the in-memory tensor first (no disk round-trip)
     if wav is None and prompt_wav is not None:
-        for key in tensor_candidates:
+        for key in TENSOR_CANDIDATES:
             if key not in param_names:
                 continue
-            ok, out, err = try_call(key, prompt_wav)
+            ok, out_audio, err = try_call(key, prompt_wav)
             tried.append((key, "tensor"))
             if ok:
-                wav = out
+                wav = out_audio
+                state["used_prompt_arg"] = (key, "tensor")
+                save_prompt_arg_cache(model, key, "tensor")
                 break
             last_err = err
 
+    # 2) Fall back to a path argument, materializing the normalized WAV on demand
+    if wav is None and speaker_wav and any(k in param_names for k in PATH_CANDIDATES):
+        path_value = ensure_prompt_path()
+        if path_value is not None:
+            for key in PATH_CANDIDATES:
+                if key not in param_names:
+                    continue
+                ok, out_audio, err = try_call(key, path_value)
+                tried.append((key, "path"))
+                if ok:
+                    wav = out_audio
+                    state["used_prompt_arg"] = (key, "path")
+                    save_prompt_arg_cache(model, key, "path")
+                    break
+                last_err = err
+
     # 3) If no prompt provided or all prompt attempts failed, try without prompt
     if wav is None:
         try:
-            wav = model.generate(**base_kwargs)
+            with torch.inference_mode(), _amp_ctx():
+                wav = model.generate(**base_kwargs)
             used_prompt_arg = None
             if args.verbose:
                 logging.info("Generated without prompt")
@@ -429,40 +721,23 @@ def main(argv: list[str] | None = None) -> int:
         # Fallback to simple beep audio if generation failed
         try:
             sr = int(getattr(model, "sr", 22050) or 22050)
-            text_len = max(1, len(args.text.strip()))
-            duration = max(1.5, min(12.0, 0.02 * text_len))
-            frames = int(sr * duration)
-            args.out.parent.mkdir(parents=True, exist_ok=True)
-            with wave.open(str(args.out), 'w') as wf:
-                wf.setnchannels(1)
-                wf.setsampwidth(2)
-                wf.setframerate(sr)
-                for i in range(frames):
-                    t = i / sr
-                    amp = 0.2
-                    if i < sr * 0.05:
-                        amp *= (i / (sr * 0.05))
-                    if i > frames - sr * 0.05:
-                        amp *= max(0.0, (frames - i) / (sr * 0.05))
-                    sample = int(max(-1.0, min(1.0, amp * math.sin(2 * math.pi * 440.0 * t))) * 32767)
-                    wf.writeframes(struct.pack('<h', sample))
-            print(json.dumps({
-                "out_path": str(args.out),
+            duration = write_beep_wav(out, text, sr=sr)
+            return {
+                "out_path": str(out),
                 "duration_sec": duration,
                 "sr": sr,
                 "used_prompt_arg": used_prompt_arg,
                 "normalized_prompt_path": normalized_prompt_path,
-                "note": "fallback_beep_audio"
-            }), flush=True)
-            return 0
-        except Exception:
+                "note": "fallback_beep_audio",
+            }
+        except Exception as beep_exc:
             # Report the error and what we tried
-            print(json.dumps({
-                "error": f"Chatterbox generate() failed: {last_err}. Fallback failed: {e}",
+            return {
+                "error": f"Chatterbox generate() failed: {last_err}. Fallback failed: {beep_exc}",
                 "tried": tried,
                 "accepted_params": sorted(param_names),
-            }), file=sys.stdout, flush=True)
-            return 4
+                "code": 4,
+            }
     # Normalize output and persist as WAV
     sr = int(getattr(model, "sr", 22050) or 22050)
 
@@ -470,15 +745,10 @@ def main(argv: list[str] | None = None) -> int:
     if isinstance(wav, (tuple, list)) and len(wav) >= 2 and isinstance(wav[1], int):
         wav, sr = wav[0], int(wav[1])
 
-    args.out.parent.mkdir(parents=True, exist_ok=True)
+    out.parent.mkdir(parents=True, exist_ok=True)
 
     def _to_tensor(x: Any):
         """Convert numpy array or torch tensor-like to torch.Tensor [channels, samples]."""
-        try:
-            import torch  # local import to avoid global dependency at parse time
-        except Exception as e:  # pragma: no cover
-            raise RuntimeError(f"torch not available to save audio: {e}")
-
         # Lazy import numpy if available
         np_local = None
         try:
@@ -494,8 +764,8 @@ def main(argv: list[str] | None = None) -> int:
         if hasattr(x, "dim") and hasattr(x, "dtype"):
             t = x
         elif np_local is not None and isinstance(x, np_local.ndarray):
-            import torch as _torch  # noqa
-            t = _torch.from_numpy(x)
+            # C-contiguity keeps from_numpy zero-copy
+            t = torch.from_numpy(np_local.ascontiguousarray(x))
         else:
             # Unknown type
             raise RuntimeError(f"Unsupported audio return type: {type(x)}")
@@ -507,70 +777,559 @@ def main(argv: list[str] | None = None) -> int:
             # Flatten extra dims conservatively: take first channel-like dimension
             t = t.reshape(t.shape[0], -1) if t.dim() >= 2 else t
 
-        # Cast to float32 if needed
+        # Cast to float32 only when needed (`.to` is a no-op for matching dtype,
+        # unlike `.float()` which may allocate regardless)
         try:
-            import torch as _torch
-            if t.dtype not in (
-                getattr(_torch, "float32", None),
-                getattr(_torch, "float", None),
-            ):
-                t = t.float()
+            if t.dtype != torch.float32:
+                t = t.to(torch.float32)
         except Exception:
             pass
         return t
 
-    saved_path = args.out
     duration_sec = None
 
+    def _write_wav_direct(tensor: Any) -> None:
+        """Write int16 PCM with the stdlib wave module, skipping ta.save dispatch."""
+        samples = tensor.detach().clamp(-1.0, 1.0).mul(32767.0).to(torch.int16).cpu().numpy()
+        with wave.open(str(out), "wb") as wf:
+            wf.setnchannels(samples.shape[0])
+            wf.setsampwidth(2)
+            wf.setframerate(sr)
+            wf.writeframes(samples.T.tobytes())
+
     try:
         # Case 1: model returned a path
         if isinstance(wav, (str, os.PathLike, Path)):
             src = Path(wav)
             if not src.exists():
                 raise RuntimeError(f"Returned audio path does not exist: {src}")
-            # Try to re-encode to WAV to guarantee format
+            # Fast path: already a WAV at the target rate — no decode/resample/encode
+            reencode = True
+            if src.suffix.lower() == ".wav":
+                try:
+                    src_info = ta.info(str(src))
+                    if int(getattr(src_info, "sample_rate", 0)) == sr:
+                        try:
+                            if out.exists():
+                                out.unlink()
+                            os.link(src, out)
+                        except OSError:
+                            shutil.copyfile(src, out)
+                        reencode = False
+                except Exception:
+                    pass
+            if reencode:
+                # Re-encode to WAV to guarantee format
+                try:
+                    audio, sr_in = ta.load(str(src))
+                    if int(sr_in) != sr:
+                        audio = resample_audio(audio, int(sr_in), sr, TAF)
+                    ta.save(str(out), audio, sr, format="wav")
+                except Exception:
+                    # Fallback: copy as-is; downstream ffmpeg/pydub can often read common formats
+                    shutil.copy2(src, out)
+            # Compute duration from saved file metadata if possible
             try:
-                audio, sr_in = ta.load(str(src))
-                if int(sr_in) != sr:
-                    audio = TAF.resample(audio, int(sr_in), sr)
-                ta.save(str(args.out), audio, sr, format="wav")
+                info = ta.info(str(out))
+                if getattr(info, "num_frames", 0) and getattr(info, "sample_rate", 0):
+                    duration_sec = float(info.num_frames) / float(info.sample_rate)
             except Exception:
-                # Fallback: copy as-is; downstream ffmpeg/pydub can often read common formats
-                shutil.copy2(src, args.out)
+                text_len = max(1, len(text.strip()))
+                duration_sec = max(1.5, min(12.0, 0.02 * text_len))
         else:
-            # Case 2: tensor/ndarray-like
+            # Case 2: tensor/ndarray-like — duration is known from the shape, so
+            # write the WAV directly and skip the ta.save + ta.info round-trip
             tensor = _to_tensor(wav)
-            ta.save(str(args.out), tensor, sr, format="wav")
-
-        # Compute duration from saved file metadata if possible
-        try:
-            info = ta.info(str(args.out))
-            if getattr(info, "num_frames", 0) and getattr(info, "sample_rate", 0):
-                duration_sec = float(info.num_frames) / float(info.sample_rate)
-        except Exception:
-            # Fallback estimation if ta.info fails
-            if isinstance(wav, (tuple, list)) and len(wav) >= 2:
-                audio_len = len(wav[0]) if hasattr(wav[0], "__len__") else 0
-                duration_sec = audio_len / sr if audio_len > 0 else None
-            else:
-                text_len = max(1, len(args.text.strip()))
-                duration_sec = max(1.5, min(12.0, 0.02 * text_len))
+            duration_sec = float(tensor.shape[-1]) / float(sr)
+            try:
+                _write_wav_direct(tensor)
+            except Exception:
+                ta.save(str(out), tensor, sr, format="wav")
     except Exception as e:
-        print(json.dumps({
-            "error": f"Failed to persist audio: {e}",
-        }), file=sys.stdout, flush=True)
-        return 5
+        return {"error": f"Failed to persist audio: {e}", "code": 5}
 
-    print(json.dumps({
-        "out_path": str(args.out),
+    return {
+        "out_path": str(out),
         "duration_sec": duration_sec,
         "sr": sr,
         "used_prompt_arg": used_prompt_arg,
         "normalized_prompt_path": normalized_prompt_path,
-    }), flush=True)
+    }
+
+
+def synthesize_batch_request(
+    model: Any,
+    *,
+    items: list,
+    args: argparse.Namespace,
+    state: dict,
+    ta: Any,
+    TAF: Any,
+    torch: Any,
+) -> dict:
+    """Synthesize a batch of utterances for a single JSON request.
+
+    When the loaded model exposes a batch API (``generate_batch``), all
+    texts could share one padded forward pass; current Chatterbox builds
+    only ship single-utterance generate(), so items run back-to-back with
+    the resident prompt and kwarg state. Either way the caller pays one
+    pipe round trip for the whole batch and gets per-item payloads back.
+    """
+    results: list = []
+    for item in items:
+        if not isinstance(item, dict):
+            results.append({"error": "Batch items must be objects"})
+            continue
+        text = str(item.get("text", ""))
+        out = item.get("out")
+        if not text or not out:
+            results.append({"error": "Batch items must include 'text' and 'out'"})
+            continue
+        speaker = item.get("speaker_wav") or args.speaker_wav
+        payload = synthesize_request(
+            model,
+            text=text,
+            out=Path(out),
+            speaker_wav=Path(speaker) if speaker else None,
+            args=args,
+            state=state,
+            ta=ta,
+            TAF=TAF,
+            torch=torch,
+        )
+        payload.pop("code", None)
+        results.append(payload)
+    return {"results": results}
+
+
+def serve_loop(
+    model: Any,
+    *,
+    args: argparse.Namespace,
+    state: dict,
+    ta: Any,
+    TAF: Any,
+    torch: Any,
+) -> int:
+    """Read JSON requests from stdin (one per line) and answer on stdout.
+
+    Request fields: {"text": str, "out": str, "speaker_wav": str|null}, or
+    {"batch": [{"text": ..., "out": ...}, ...]} which answers with one
+    {"results": [...]} line. The model (and the discovered generate() kwarg
+    names) stay resident between requests, so per-utterance cost is a
+    single forward pass.
+    """
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            req = json.loads(line)
+        except json.JSONDecodeError as exc:
+            _emit({"error": f"Invalid JSON request: {exc}"})
+            continue
+        batch = req.get("batch")
+        if batch is not None:
+            if not isinstance(batch, list):
+                _emit({"error": "'batch' must be a list of requests"})
+                continue
+            _emit(
+                synthesize_batch_request(
+                    model, items=batch, args=args, state=state, ta=ta, TAF=TAF, torch=torch
+                )
+            )
+            continue
+        text = str(req.get("text", ""))
+        out = req.get("out")
+        if not text or not out:
+            _emit({"error": "Request must include 'text' and 'out'"})
+            continue
+        speaker = req.get("speaker_wav") or args.speaker_wav
+        payload = synthesize_request(
+            model,
+            text=text,
+            out=Path(out),
+            speaker_wav=Path(speaker) if speaker else None,
+            args=args,
+            state=state,
+            ta=ta,
+            TAF=TAF,
+            torch=torch,
+        )
+        payload.pop("code", None)
+        _emit(payload)
     return 0
 
 
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Chatterbox TTS CLI")
+    parser.add_argument("--text", help="Text to synthesize (required unless --serve or --text-file)")
+    parser.add_argument(
+        "--text-file",
+        dest="text_file",
+        type=Path,
+        help="File with one text per line; synthesizes all of them in a single process (out paths get a _NNNN suffix)",
+    )
+    parser.add_argument("--out", type=Path, help="Output WAV path (required unless --serve)")
+    parser.add_argument("--speaker-wav", dest="speaker_wav", type=Path, help="Reference voice WAV path for cloning")
+    parser.add_argument(
+        "--speaker-tensor",
+        dest="speaker_tensor",
+        type=Path,
+        help="Pre-decoded prompt tensor (.pt with {'wav': Tensor, 'sr': int}); skips the per-call decode+resample",
+    )
+    parser.add_argument("--device", default="cpu", help="torch device: cpu or cuda")
+    parser.add_argument("--language", default="en", help="Language id for multilingual model (e.g. en, fr, zh)")
+    parser.add_argument("--multilingual", action="store_true", help="Use multilingual model")
+    parser.add_argument("--exaggeration", type=float, default=0.5, help="Emotion/exaggeration control (0..1)")
+    parser.add_argument("--cfg-weight", dest="cfg_weight", type=float, default=0.5, help="Guidance weight (0..1)")
+    parser.add_argument(
+        "--steps",
+        type=int,
+        default=int(os.environ.get("CHATTERBOX_STEPS", "50")),
+        help="Number of inference steps for model.generate() if supported (CPU-friendly default)",
+    )
+    parser.add_argument(
+        "--attn-impl",
+        dest="attn_impl",
+        default=os.environ.get("CHATTERBOX_ATTN_IMPL"),
+        help="Attention implementation hint for model.generate() or model (e.g., 'eager') if supported",
+    )
+    parser.add_argument(
+        "--max-new-tokens",
+        dest="max_new_tokens",
+        type=int,
+        default=int(os.environ.get("CHATTERBOX_MAX_NEW_TOKENS", "64")),
+        help="Limit LLM token generation if model.generate() accepts it (e.g., max_new_tokens)",
+    )
+    parser.add_argument(
+        "--quantize",
+        choices=["none", "dynamic"],
+        default=os.environ.get("CHATTERBOX_QUANTIZE", "none"),
+        help="Apply dynamic int8 quantization to Linear layers on CPU (VNNI int8 GEMM)",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=["auto", "fp32", "bf16", "fp16"],
+        default=os.environ.get("CHATTERBOX_PRECISION", "auto"),
+        help="Autocast precision for generate(): auto picks fp16 on CUDA and bf16 on capable CPUs",
+    )
+    parser.add_argument(
+        "--cuda-graph",
+        dest="cuda_graph",
+        action="store_true",
+        help="Capture the decoder step with CUDA Graphs after warmup (CUDA only; falls back to eager)",
+    )
+    parser.add_argument(
+        "--serve",
+        action="store_true",
+        help="Run as a long-lived worker: load the model once, then read JSON requests from stdin",
+    )
+    parser.add_argument("--verbose", action="store_true", help="Enable debug logging")
+
+    args = parser.parse_args(argv)
+
+    if not args.serve and ((not args.text and not args.text_file) or not args.out):
+        parser.error("--text (or --text-file) and --out are required unless --serve is given")
+
+    if args.verbose:
+        logging.basicConfig(level=logging.DEBUG, format="%(levelname)s: %(message)s", stream=sys.stderr)
+        _clean_sys_path_and_env(verbose=True)
+    else:
+        _clean_sys_path_and_env()
+
+    torch = None
+    ta = None
+
+    # Thread env must be exported before torch import so oneDNN/MKL honor it
+    num_threads = configure_cpu_threads()
+
+    # Caching-allocator tuning must land before the first CUDA op, i.e. before torch import
+    if args.device.startswith("cuda"):
+        os.environ.setdefault("PYTORCH_CUDA_ALLOC_CONF", "expandable_segments:True,max_split_size_mb:128")
+
+    # Lightweight fallback: if heavy deps are missing, synthesize a simple beep WAV so dev can proceed
+    try:
+        import torch
+        import torchaudio as ta
+        from chatterbox.tts import ChatterboxTTS
+        # Multilingual model (and its tokenizers/language data) only when requested
+        if args.multilingual:
+            from chatterbox.mtl_tts import ChatterboxMultilingualTTS  # type: ignore
+        TAF = _LazyTAF()
+    except Exception as exc:
+        if args.serve:
+            # Keep the worker contract alive: answer every request with a beep
+            for line in sys.stdin:
+                line = line.strip()
+                if not line:
+                    continue
+                def _beep_payload(item: dict) -> dict:
+                    out = Path(item["out"])
+                    duration = write_beep_wav(out, str(item.get("text", "")))
+                    return {
+                        "out_path": str(out),
+                        "duration_sec": duration,
+                        "sr": 22050,
+                        "used_prompt_arg": None,
+                        "normalized_prompt_path": None,
+                        "note": "fallback_beep_audio",
+                    }
+
+                try:
+                    req = json.loads(line)
+                    if req.get("batch") is not None:
+                        results = []
+                        for item in req["batch"]:
+                            try:
+                                results.append(_beep_payload(item))
+                            except Exception as e:
+                                results.append({"error": f"Missing dependencies: {exc}. Fallback failed: {e}"})
+                        _emit({"results": results})
+                    else:
+                        _emit(_beep_payload(req))
+                except Exception as e:
+                    _emit({"error": f"Missing dependencies: {exc}. Fallback failed: {e}"})
+            return 0
+        if args.text_file:
+            try:
+                texts = [ln.strip() for ln in args.text_file.read_text(encoding="utf-8").splitlines() if ln.strip()]
+                suffix = args.out.suffix or ".wav"
+                for i, text in enumerate(texts):
+                    out_path = args.out if len(texts) == 1 else args.out.with_name(f"{args.out.stem}_{i:04d}{suffix}")
+                    duration = write_beep_wav(out_path, text)
+                    _emit({
+                        "out_path": str(out_path),
+                        "duration_sec": duration,
+                        "sr": 22050,
+                        "used_prompt_arg": None,
+                        "normalized_prompt_path": None,
+                        "note": "fallback_beep_audio",
+                    })
+                return 0
+            except Exception as e:
+                _emit({"error": f"Missing dependencies: {exc}. Fallback failed: {e}"})
+                return 2
+        # Fallback: produce a short sine beep WAV using only stdlib
+        try:
+            duration = write_beep_wav(args.out, args.text)
+            _emit({
+                "out_path": str(args.out),
+                "duration_sec": duration,
+                "sr": 22050,
+                "used_prompt_arg": None,
+                "normalized_prompt_path": None,
+                "note": "fallback_beep_audio",
+            })
+            return 0
+        except Exception as e:
+            _emit({
+                "error": f"Missing dependencies: {exc}. Install with: pip install chatterbox-tts torch torchaudio. Fallback failed: {e}"
+            })
+            return 2
+
+    device = args.device
+    try:
+        if device.startswith("cuda") and not torch.cuda.is_available():
+            device = "cpu"
+            if args.verbose:
+                logging.info("Fallback to CPU: CUDA unavailable")
+    except Exception:
+        device = "cpu"
+
+    # Inference only: disable autograd bookkeeping globally (generate() calls
+    # additionally run under torch.inference_mode())
+    try:
+        torch.set_grad_enabled(False)
+        if device.startswith("cuda"):
+            torch.backends.cudnn.benchmark = True
+    except Exception:
+        pass
+
+    # CPU thread tuning: saturate physical cores for the transformer forward
+    try:
+        _it = int(os.environ.get("TORCH_NUM_INTEROP_THREADS", "1"))
+        torch.set_num_threads(num_threads)
+        torch.set_num_interop_threads(_it)
+        if args.verbose:
+            logging.debug(f"Set Torch threads: num={num_threads}, interop={_it}")
+    except (ValueError, AttributeError, RuntimeError) as e:
+        if args.verbose:
+            logging.warning(f"Thread tuning failed: {e}")
+
+    # Load model, passing attention implementation to from_pretrained if supported
+    pretrained_kwargs = {}
+    if args.attn_impl:
+        try:
+            if "attn_implementation" in inspect.signature(ChatterboxTTS.from_pretrained).parameters:
+                pretrained_kwargs["attn_implementation"] = args.attn_impl
+        except Exception:
+            pass
+
+    try:
+        if args.multilingual:
+            model = ChatterboxMultilingualTTS.from_pretrained(device=device, **pretrained_kwargs)  # type: ignore[name-defined]
+        else:
+            model = ChatterboxTTS.from_pretrained(device=device, **pretrained_kwargs)
+    except TypeError:
+        # Fallback if the extra kwargs are not supported
+        if args.multilingual:
+            model = ChatterboxMultilingualTTS.from_pretrained(device=device)  # type: ignore[name-defined]
+        else:
+            model = ChatterboxTTS.from_pretrained(device=device)
+
+    # Try to set attention implementation flag on model/pipeline if present
+    if args.attn_impl:
+        for obj in [model, getattr(model, "pipeline", None), getattr(model, "model", None)]:
+            if obj is not None and hasattr(obj, "attn_implementation"):
+                try:
+                    setattr(obj, "attn_implementation", args.attn_impl)
+                except Exception:
+                    pass
+
+    # Clamp token generation on HF text backends if accessible
+    for obj in [model, getattr(model, "pipeline", None), getattr(model, "model", None), getattr(model, "generator", None)]:
+        if obj is None:
+            continue
+        gen_cfg = getattr(obj, "generation_config", None)
+        if gen_cfg is not None:
+            try:
+                if hasattr(gen_cfg, "max_new_tokens"):
+                    setattr(gen_cfg, "max_new_tokens", int(max(1, args.max_new_tokens)))
+                if hasattr(gen_cfg, "max_length"):
+                    # Ensure total length is reasonable on CPU
+                    ml = int(max(8, args.max_new_tokens + 16))
+                    setattr(gen_cfg, "max_length", ml)
+            except Exception:
+                pass
+
+    # Try to set default step count on model/pipeline if exposed as attribute
+    for obj in [model, getattr(model, "pipeline", None), getattr(model, "diffusion", None)]:
+        if obj is None:
+            continue
+        for key in [
+            "num_inference_steps","steps","n_steps","inference_steps","num_steps",
+            "num_sampling_steps","n_inference_steps","num_iters","n_iters","iterations",
+        ]:
+            if hasattr(obj, key):
+                try:
+                    setattr(obj, key, args.steps)
+                    break
+                except Exception:
+                    pass
+
+    # Dynamic int8 quantization of the linear-heavy decoder (CPU only; must be
+    # applied before any torch.compile)
+    if args.quantize == "dynamic" and device == "cpu":
+        try:
+            import torch.nn as nn
+            from torch.ao.quantization import quantize_dynamic
+
+            if isinstance(model, nn.Module):
+                model = quantize_dynamic(model, {nn.Linear}, dtype=torch.qint8)
+            else:
+                # Wrapper object: quantize the inner modules in place
+                for attr in ("model", "transformer", "backbone", "generator"):
+                    inner = getattr(model, attr, None)
+                    if isinstance(inner, nn.Module):
+                        setattr(model, attr, quantize_dynamic(inner, {nn.Linear}, dtype=torch.qint8))
+            if args.verbose:
+                logging.debug("Dynamic int8 quantization applied")
+        except Exception as exc:
+            if args.verbose:
+                logging.warning(f"Dynamic quantization failed: {exc}")
+
+    # torch.compile pays a one-off warmup, so it defaults on only for the modes
+    # that amortize it (--serve / --text-file); CHATTERBOX_COMPILE overrides
+    compile_default = "1" if (args.serve or args.text_file) else "0"
+    if os.environ.get("CHATTERBOX_COMPILE", compile_default) == "1":
+        model = maybe_compile_model(model, torch, verbose=args.verbose)
+
+    # Prime the CUDA caching allocator so steady-state steps avoid cudaMalloc/cudaFree
+    if device.startswith("cuda"):
+        try:
+            torch.cuda.memory.set_per_process_memory_fraction(0.9)
+        except Exception:
+            pass
+        try:
+            with torch.inference_mode():
+                model.generate(text="a")
+            if args.verbose:
+                logging.debug("CUDA warmup generate() completed")
+        except Exception as exc:
+            if args.verbose:
+                logging.debug(f"CUDA warmup generate() skipped: {exc}")
+
+    # Opt-in CUDA Graph replay of the per-step callable (kernel-launch overhead win)
+    if args.cuda_graph and device.startswith("cuda"):
+        if try_enable_cuda_graph(model, torch, verbose=args.verbose):
+            if args.verbose:
+                logging.info("CUDA graph step wrapper installed")
+        elif args.verbose:
+            logging.info("No capturable step callable found; staying eager")
+
+    # Debug: print effective settings (stderr so stdout remains JSON-only for the pipeline)
+    try:
+        print(f"[chatterbox] device={device} steps={args.steps} attn_impl={args.attn_impl}", file=sys.stderr, flush=True)
+    except Exception:
+        pass
+
+    # Per-process cache for signature introspection and the winning prompt kwarg
+    state: dict = {}
+
+    # Mixed-precision autocast settings shared by every generate() call
+    amp_device = "cuda" if device.startswith("cuda") else "cpu"
+    amp_dtype = resolve_autocast_dtype(torch, device, args.precision)
+    state["amp"] = (amp_device, amp_dtype)
+    if args.verbose and amp_dtype is not None:
+        logging.debug(f"Autocast enabled: device_type={amp_device} dtype={amp_dtype}")
+
+    if args.serve:
+        return serve_loop(model, args=args, state=state, ta=ta, TAF=TAF, torch=torch)
+
+    if args.text_file:
+        # Batch mode: one model load amortized across every line; the resolved
+        # prompt kwarg and cached signature are reused after the first call
+        texts = [ln.strip() for ln in args.text_file.read_text(encoding="utf-8").splitlines() if ln.strip()]
+        if not texts:
+            _emit({"error": f"No texts found in {args.text_file}"})
+            return 2
+        code = 0
+        suffix = args.out.suffix or ".wav"
+        for i, text in enumerate(texts):
+            out_path = args.out if len(texts) == 1 else args.out.with_name(f"{args.out.stem}_{i:04d}{suffix}")
+            payload = synthesize_request(
+                model,
+                text=text,
+                out=out_path,
+                speaker_wav=args.speaker_wav,
+                args=args,
+                state=state,
+                ta=ta,
+                TAF=TAF,
+                torch=torch,
+            )
+            if "error" in payload:
+                code = payload.pop("code", 1)
+            _emit(payload)
+        return code
+
+    payload = synthesize_request(
+        model,
+        text=args.text,
+        out=args.out,
+        speaker_wav=args.speaker_wav,
+        args=args,
+        state=state,
+        ta=ta,
+        TAF=TAF,
+        torch=torch,
+    )
+    code = payload.pop("code", 0) if "error" in payload else 0
+    _emit(payload)
+    return code
+
+
 if __name__ == "__main__":
     try:
         sys.exit(main())
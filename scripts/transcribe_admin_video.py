@@ -3,28 +3,35 @@
 from __future__ import annotations
 
 import argparse
+import functools
 import json
+import math
+import os
 import subprocess
+from collections import deque
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List, Optional
 
 try:
-    import whisper
-    from whisper.utils import write_srt
-except ImportError as exc:  # pragma: no cover - optional dependency
-    raise SystemExit(
-        "The `openai-whisper` package is required for transcription.\n"
-        "Install it with `pip install openai-whisper`."
-    ) from exc
+    import orjson  # C-accelerated; several times faster than stdlib json
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
-try:
-    from pydub import AudioSegment
-except ImportError as exc:  # pragma: no cover - optional dependency
-    raise SystemExit(
-        "The `pydub` package is required for audio preprocessing.\n"
-        "Install it with `pip install pydub`."
-    ) from exc
+
+@functools.lru_cache(maxsize=None)
+def _audio_libs():
+    """Import numpy/soundfile on first use so --help and arg errors stay instant."""
+
+    try:
+        import numpy as np
+        import soundfile as sf
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise SystemExit(
+            "The `numpy` and `soundfile` packages are required for audio preprocessing.\n"
+            "Install them with `pip install numpy soundfile`."
+        ) from exc
+    return np, sf
 
 
 @dataclass
@@ -47,25 +54,85 @@ class PipelineError(RuntimeError):
 # ---------------------------------------------------------------------------
 
 def run_command(command: List[str], *, cwd: Optional[Path] = None) -> None:
-    """Execute a shell command and raise a helpful error message on failure."""
-
-    result = subprocess.run(command, cwd=cwd, check=False, capture_output=True, text=True)
-    if result.returncode != 0:
-        stderr = result.stderr.strip() or result.stdout
-        raise PipelineError(f"Command {' '.join(command)} failed: {stderr}")
+    """Execute a shell command and raise a helpful error message on failure.
+
+    stderr is streamed and only a bounded tail is retained, so chatty tools
+    like ffmpeg never buffer their full log in memory on long inputs.
+    """
+
+    proc = subprocess.Popen(
+        command,
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    )
+    tail: deque = deque(maxlen=200)
+    assert proc.stderr is not None
+    for line in proc.stderr:
+        tail.append(line)
+    if proc.wait() != 0:
+        raise PipelineError(f"Command {' '.join(command)} failed: {''.join(tail).strip()}")
 
 
 # ---------------------------------------------------------------------------
 # Audio processing
 # ---------------------------------------------------------------------------
 
-def extract_audio(input_video: Path, output_wav: Path) -> None:
-    """Extract the highest-quality audio stream from the video."""
+def _ffmpeg(args: List[str]) -> None:
+    """Run ffmpeg quietly with full threading enabled.
+
+    The FFT denoiser and filter graphs are CPU-bound; `-threads 0` plus the
+    filter threading flags let them use every core instead of the defaults.
+    """
 
+    cpu_count = str(os.cpu_count() or 1)
     run_command(
         [
             "ffmpeg",
+            "-hide_banner",
+            "-nostats",
+            "-loglevel",
+            "error",
+            "-threads",
+            "0",
+            "-filter_threads",
+            cpu_count,
+            "-filter_complex_threads",
+            cpu_count,
             "-y",
+            *args,
+        ]
+    )
+
+
+def _drop_page_cache(path: Path) -> None:
+    """Advise the kernel to evict a consumed intermediate from the page cache.
+
+    The staged WAV chain can run to hundreds of MB per file; once a stage's
+    input has been read for the last time its pages only crowd out model
+    weights, so POSIX_FADV_DONTNEED releases them. Best-effort: platforms
+    without posix_fadvise simply skip it.
+    """
+
+    try:
+        fd = os.open(str(path), os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    except (AttributeError, OSError):
+        pass
+    finally:
+        os.close(fd)
+
+
+def extract_audio(input_video: Path, output_wav: Path) -> None:
+    """Extract the highest-quality audio stream from the video."""
+
+    _ffmpeg(
+        [
             "-i",
             str(input_video),
             "-q:a",
@@ -82,10 +149,8 @@ def denoise_audio(input_wav: Path, output_wav: Path, *, noise_floor: float) -> N
 
     # afftdn works well for broadband noise and does not require external models.
     audio_filter = f"afftdn=nf={noise_floor}"
-    run_command(
+    _ffmpeg(
         [
-            "ffmpeg",
-            "-y",
             "-i",
             str(input_wav),
             "-af",
@@ -96,16 +161,69 @@ def denoise_audio(input_wav: Path, output_wav: Path, *, noise_floor: float) -> N
 
 
 def normalize_audio(input_wav: Path, output_wav: Path, *, target_peak_dbfs: float) -> None:
-    """Normalise the audio to the requested peak level using pydub."""
+    """Normalise the audio to the requested peak level with vectorised NumPy.
+
+    One multiply over a float32 array replaces pydub's Python-level gain pass.
+    """
 
-    audio = AudioSegment.from_file(input_wav)
-    peak = audio.max_dBFS
-    # Guard against silence which reports -inf
-    if peak == float("-inf"):
+    np, sf = _audio_libs()
+    data, sample_rate = sf.read(str(input_wav), dtype="float32")
+    peak = float(np.max(np.abs(data))) if data.size else 0.0
+    # Guard against silence which would give a -inf peak level
+    if peak <= 0.0:
         raise PipelineError("The extracted audio is silent; cannot normalise.")
-    gain = target_peak_dbfs - peak
-    normalized = audio.apply_gain(gain)
-    normalized.export(output_wav, format="wav")
+    peak_dbfs = 20.0 * math.log10(peak)
+    data *= 10.0 ** ((target_peak_dbfs - peak_dbfs) / 20.0)
+    sf.write(str(output_wav), data, sample_rate, subtype="PCM_16")
+
+
+def _silenceremove_filter(*, threshold: float, min_silence_ms: int, keep_silence_ms: int) -> str:
+    """Build the silenceremove filter expression for edge-silence trimming."""
+
+    # ffmpeg's silenceremove expects negative dBFS thresholds.
+    return (
+        "silenceremove="
+        f"start_periods=1:start_threshold={threshold}dB:start_silence={min_silence_ms / 1000}:"
+        f"stop_periods=1:stop_threshold={threshold}dB:stop_silence={min_silence_ms / 1000}:"
+        f"leave_silence={keep_silence_ms / 1000}"
+    )
+
+
+def clean_audio_single_pass(
+    input_video: Path,
+    output_wav: Path,
+    *,
+    noise_floor: float,
+    target_peak_dbfs: float,
+    denoise: bool = True,
+    trim_opts: Optional[dict] = None,
+) -> None:
+    """Extract, denoise and optionally trim in one ffmpeg invocation, then normalise.
+
+    The staged pipeline decodes and re-encodes the full WAV once per stage;
+    chaining the extract/denoise/trim filters keeps the audio in memory and
+    cuts those round-trips to one. Normalisation stays the vectorised NumPy
+    peak pass so --target-peak keeps its dBFS contract and the source
+    sample rate is preserved (ffmpeg's loudnorm would swap peak for EBU
+    loudness semantics and resample the output to 192 kHz). Trimming runs
+    before the gain is applied, so silence thresholds are measured against
+    the source levels rather than the normalised peak.
+    """
+
+    filters: List[str] = []
+    if denoise:
+        filters.append(f"afftdn=nf={noise_floor}")
+    if trim_opts:
+        filters.append(_silenceremove_filter(**trim_opts))
+    prenorm_wav = output_wav.with_name(f"{output_wav.stem}_prenorm.wav")
+    command = ["-i", str(input_video), "-map", "a"]
+    if filters:
+        command += ["-af", ",".join(filters)]
+    _ffmpeg(command + [str(prenorm_wav)])
+    try:
+        normalize_audio(prenorm_wav, output_wav, target_peak_dbfs=target_peak_dbfs)
+    finally:
+        prenorm_wav.unlink(missing_ok=True)
 
 
 def trim_silence(
@@ -118,17 +236,11 @@ def trim_silence(
 ) -> None:
     """Trim leading and trailing silence using ffmpeg's silenceremove."""
 
-    # ffmpeg's silenceremove expects negative dBFS thresholds.
-    filter_expr = (
-        "silenceremove="
-        f"start_periods=1:start_threshold={threshold}dB:start_silence={min_silence_ms / 1000}:"
-        f"stop_periods=1:stop_threshold={threshold}dB:stop_silence={min_silence_ms / 1000}:"
-        f"leave_silence={keep_silence_ms / 1000}"
+    filter_expr = _silenceremove_filter(
+        threshold=threshold, min_silence_ms=min_silence_ms, keep_silence_ms=keep_silence_ms
     )
-    run_command(
+    _ffmpeg(
         [
-            "ffmpeg",
-            "-y",
             "-i",
             str(input_wav),
             "-af",
@@ -142,7 +254,67 @@ def trim_silence(
 # Transcription
 # ---------------------------------------------------------------------------
 
-def transcribe(
+class _ModelCache:
+    """Process-level cache for Whisper weights keyed by (model name, device).
+
+    Model load dominates runtime for short clips and repeated calls when this
+    module is imported rather than run as a one-shot script.
+    """
+
+    _model = None
+    _model_name: Optional[str] = None
+    _device: Optional[str] = None
+
+    @classmethod
+    def get(cls, loader, model_name: str, device: Optional[str]):
+        if cls._model is not None and (cls._model_name, cls._device) == (model_name, device):
+            return cls._model
+        cls.unload()
+        cls._model = loader(model_name, device)
+        cls._model_name, cls._device = model_name, device
+        return cls._model
+
+    @classmethod
+    def unload(cls) -> None:
+        if cls._model is None:
+            return
+        cls._model = None
+        cls._model_name = cls._device = None
+        import gc
+
+        gc.collect()
+        try:
+            import torch
+
+            if torch.cuda.is_available():
+                torch.cuda.empty_cache()
+        except Exception:
+            pass
+
+
+def _optimize_whisper_for_cuda(model, device: Optional[str]):
+    """Best-effort CUDA decode tuning: TF32, static KV cache, compiled forward.
+
+    Paid once at load time (the model is cached), so the compile cost is
+    amortized over every subsequent transcribe() call.
+    """
+    if not (device or "").startswith("cuda"):
+        return model
+    try:
+        import torch
+
+        torch.backends.cuda.matmul.allow_tf32 = True
+        torch.backends.cudnn.benchmark = True
+        gen_cfg = getattr(model, "generation_config", None)
+        if gen_cfg is not None and hasattr(gen_cfg, "cache_implementation"):
+            gen_cfg.cache_implementation = "static"
+        model.forward = torch.compile(model.forward, mode="reduce-overhead", fullgraph=True)
+    except Exception:
+        pass
+    return model
+
+
+def transcribe_with_openai_whisper(
     audio_path: Path,
     *,
     model_name: str,
@@ -150,9 +322,21 @@ def transcribe(
     temperature: float,
     word_timestamps: bool,
 ) -> dict:
-    """Run Whisper locally and return the full transcription payload."""
-
-    model = whisper.load_model(model_name, device=device)
+    """Run the reference openai-whisper implementation locally."""
+
+    try:
+        import whisper
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise SystemExit(
+            "The `openai-whisper` package is required for the whisper backend.\n"
+            "Install it with `pip install openai-whisper`."
+        ) from exc
+
+    model = _ModelCache.get(
+        lambda name, dev: _optimize_whisper_for_cuda(whisper.load_model(name, device=dev), dev),
+        model_name,
+        device,
+    )
     result = model.transcribe(
         str(audio_path),
         temperature=temperature,
@@ -164,13 +348,120 @@ def transcribe(
     return result
 
 
+def transcribe_with_faster_whisper(
+    audio_path: Path,
+    *,
+    model_name: str,
+    device: Optional[str],
+    temperature: float,
+    word_timestamps: bool,
+) -> dict:
+    """Run faster-whisper (CTranslate2 backend): quantized kernels, ~4x faster decode."""
+
+    try:
+        from faster_whisper import WhisperModel
+    except ImportError as exc:  # pragma: no cover - optional dependency
+        raise SystemExit(
+            "The `faster-whisper` package is required for the faster-whisper backend.\n"
+            "Install it with `pip install faster-whisper`, or pass --backend whisper."
+        ) from exc
+
+    dev = (device or "cpu").lower()
+    ct2_device = "cuda" if dev.startswith("cuda") else "cpu"
+    compute_type = "float16" if ct2_device == "cuda" else "int8"
+    model = _ModelCache.get(
+        lambda name, d: WhisperModel(name, device=d, compute_type=compute_type),
+        model_name,
+        ct2_device,
+    )
+    segments_iter, _info = model.transcribe(
+        str(audio_path),
+        temperature=temperature,
+        word_timestamps=word_timestamps,
+        vad_filter=True,
+    )
+
+    # Adapt to openai-whisper's payload shape so downstream writers are unchanged
+    segments = []
+    for i, seg in enumerate(segments_iter):
+        entry = {
+            "id": i,
+            "start": float(seg.start),
+            "end": float(seg.end),
+            "text": seg.text,
+        }
+        if word_timestamps and getattr(seg, "words", None):
+            entry["words"] = [
+                {"start": float(w.start), "end": float(w.end), "word": w.word}
+                for w in seg.words
+            ]
+        segments.append(entry)
+    if not segments:
+        raise PipelineError("Whisper did not return any segments; check the audio quality.")
+    return {"segments": segments}
+
+
+def transcribe(
+    audio_path: Path,
+    *,
+    model_name: str,
+    device: Optional[str],
+    temperature: float,
+    word_timestamps: bool,
+    backend: str = "faster-whisper",
+) -> dict:
+    """Transcribe with the selected backend and return the transcription payload."""
+
+    if backend == "faster-whisper":
+        return transcribe_with_faster_whisper(
+            audio_path,
+            model_name=model_name,
+            device=device,
+            temperature=temperature,
+            word_timestamps=word_timestamps,
+        )
+    return transcribe_with_openai_whisper(
+        audio_path,
+        model_name=model_name,
+        device=device,
+        temperature=temperature,
+        word_timestamps=word_timestamps,
+    )
+
+
+def _format_srt_timestamp(seconds: float) -> str:
+    millis = int(round(max(0.0, seconds) * 1000))
+    hours, millis = divmod(millis, 3_600_000)
+    minutes, millis = divmod(millis, 60_000)
+    secs, millis = divmod(millis, 1000)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+
+def write_srt(segments: Iterable[dict], file) -> None:
+    """Write segments in SRT format (same layout as whisper.utils.write_srt)."""
+
+    for i, segment in enumerate(segments, start=1):
+        print(
+            f"{i}\n"
+            f"{_format_srt_timestamp(segment['start'])} --> {_format_srt_timestamp(segment['end'])}\n"
+            f"{segment['text'].strip().replace('-->', '->')}\n",
+            file=file,
+            flush=True,
+        )
+
+
 def write_transcripts(segments: Iterable[dict], json_path: Path, srt_path: Path) -> None:
     """Persist Whisper segments as JSON and SRT files."""
 
     segment_list = list(segments)
 
-    with json_path.open("w", encoding="utf-8") as json_file:
-        json.dump(segment_list, json_file, indent=2, ensure_ascii=False)
+    # Word-timestamp payloads on long videos reach tens of MB; orjson
+    # serialises them in one C pass and we write the bytes in one call.
+    if orjson is not None:
+        json_path.write_bytes(orjson.dumps(segment_list, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with json_path.open("w", encoding="utf-8") as json_file:
+            json.dump(segment_list, json_file, indent=2, ensure_ascii=False)
 
     with srt_path.open("w", encoding="utf-8") as srt_file:
         write_srt(segment_list, file=srt_file)
@@ -201,6 +492,12 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default="cpu",
         help="Torch device to use for Whisper (cpu, cuda, etc.)",
     )
+    parser.add_argument(
+        "--backend",
+        choices=["faster-whisper", "whisper"],
+        default="faster-whisper",
+        help="Transcription backend (faster-whisper is ~4x faster via CTranslate2 int8/float16)",
+    )
     parser.add_argument(
         "--temperature",
         type=float,
@@ -252,6 +549,11 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Skip the afftdn denoising stage",
     )
+    parser.add_argument(
+        "--legacy-stages",
+        action="store_true",
+        help="Run extract/denoise/normalise/trim as separate passes instead of one fused ffmpeg call",
+    )
     parser.add_argument(
         "--skip-transcription",
         action="store_true",
@@ -281,45 +583,69 @@ def main(argv: Optional[List[str]] = None) -> None:
 
     artefacts = build_output_paths(video_path, args.output_dir)
 
-    print(f"[pipeline] Extracting audio -> {artefacts.original_audio}")
-    extract_audio(video_path, artefacts.original_audio)
-
-    current_audio = artefacts.original_audio
-
-    if args.skip_denoise:
-        print("[pipeline] Skipping denoise stage by request")
+    if args.legacy_stages:
+        print(f"[pipeline] Extracting audio -> {artefacts.original_audio}")
+        extract_audio(video_path, artefacts.original_audio)
+
+        current_audio = artefacts.original_audio
+
+        if args.skip_denoise:
+            print("[pipeline] Skipping denoise stage by request")
+        else:
+            print(f"[pipeline] Denoising audio -> {artefacts.denoised_audio}")
+            denoise_audio(current_audio, artefacts.denoised_audio, noise_floor=args.noise_floor)
+            _drop_page_cache(current_audio)  # original_audio.wav is no longer read
+            current_audio = artefacts.denoised_audio
+
+        print(f"[pipeline] Normalising audio to {args.target_peak} dBFS -> {artefacts.clean_audio}")
+        normalize_audio(current_audio, artefacts.clean_audio, target_peak_dbfs=args.target_peak)
+        _drop_page_cache(current_audio)
+        current_audio = artefacts.clean_audio
+
+        if args.trim_silence:
+            trimmed_path = artefacts.clean_audio.with_name("clean_audio_trimmed.wav")
+            print(f"[pipeline] Trimming silence -> {trimmed_path}")
+            trim_silence(
+                current_audio,
+                trimmed_path,
+                threshold=args.silence_threshold,
+                min_silence_ms=args.min_silence_ms,
+                keep_silence_ms=args.keep_silence_ms,
+            )
+            current_audio = trimmed_path
     else:
-        print(f"[pipeline] Denoising audio -> {artefacts.denoised_audio}")
-        denoise_audio(current_audio, artefacts.denoised_audio, noise_floor=args.noise_floor)
-        current_audio = artefacts.denoised_audio
-
-    print(f"[pipeline] Normalising audio to {args.target_peak} dBFS -> {artefacts.clean_audio}")
-    normalize_audio(current_audio, artefacts.clean_audio, target_peak_dbfs=args.target_peak)
-    current_audio = artefacts.clean_audio
-
-    if args.trim_silence:
-        trimmed_path = artefacts.clean_audio.with_name("clean_audio_trimmed.wav")
-        print(f"[pipeline] Trimming silence -> {trimmed_path}")
-        trim_silence(
-            current_audio,
-            trimmed_path,
-            threshold=args.silence_threshold,
-            min_silence_ms=args.min_silence_ms,
-            keep_silence_ms=args.keep_silence_ms,
+        print(f"[pipeline] Cleaning audio in one ffmpeg pass -> {artefacts.clean_audio}")
+        trim_opts = (
+            {
+                "threshold": args.silence_threshold,
+                "min_silence_ms": args.min_silence_ms,
+                "keep_silence_ms": args.keep_silence_ms,
+            }
+            if args.trim_silence
+            else None
+        )
+        clean_audio_single_pass(
+            video_path,
+            artefacts.clean_audio,
+            noise_floor=args.noise_floor,
+            target_peak_dbfs=args.target_peak,
+            denoise=not args.skip_denoise,
+            trim_opts=trim_opts,
         )
-        current_audio = trimmed_path
+        current_audio = artefacts.clean_audio
 
     if args.skip_transcription:
         print("[pipeline] Transcription skipped; pipeline finished after audio prep")
         return
 
-    print(f"[pipeline] Transcribing with Whisper model '{args.model}' on {args.device}")
+    print(f"[pipeline] Transcribing with {args.backend} model '{args.model}' on {args.device}")
     result = transcribe(
         current_audio,
         model_name=args.model,
         device=args.device,
         temperature=args.temperature,
         word_timestamps=args.word_timestamps,
+        backend=args.backend,
     )
     segments = result["segments"]
 
@@ -14,7 +14,7 @@ explicitly via the command-line options.
 Prerequisites
 -------------
 - ffmpeg and ffprobe available on the PATH.
-- Python packages: `faster-whisper` (recommended) or `openai-whisper`, plus `pydub`, `torch`/`torchaudio`, and `chatterbox-tts`.
+- Python packages: `faster-whisper` (recommended) or `openai-whisper`, plus `numpy`, `soundfile`, `torch`/`torchaudio`, and `chatterbox-tts`.
 - A clean voice sample WAV/MP3 that will be used as the audio prompt for zero-shot cloning.
 
 Example
@@ -36,36 +36,101 @@ locations so you can review or reuse them as needed.
 from __future__ import annotations
 
 import argparse
+import functools
+import hashlib
 import json
 import logging
 import math
 import os
+import queue
 import shutil
 import subprocess
 import sys
 import tempfile
+import threading
+import wave
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Iterable, List, Optional
+from typing import Any, Iterable, List, Optional, Tuple
 
-from pydub import AudioSegment
-from pydub.effects import normalize, speedup  # Fixed: Import speedup
+try:
+    import orjson  # C-accelerated; several times faster than stdlib json
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
 
 
-@dataclass
+# Module logger with lazy %-formatting: messages only render when a handler
+# actually emits them, and consumers can silence this module alone.
+logger = logging.getLogger(__name__)
+
+
+def _configure_blas_threads() -> None:
+    """Export a physical-core thread count to the BLAS/OpenMP env.
+
+    CTranslate2 and torch size their thread pools when first imported (which
+    happens lazily, deep inside the transcription helpers), so this must run
+    at module load. SMT siblings contend for the same FMA units, so the
+    default oversubscribes big boxes; explicit settings always win.
+    """
+
+    physical = None
+    try:
+        import psutil  # type: ignore
+        physical = psutil.cpu_count(logical=False)
+    except Exception:
+        pass
+    nt = physical or max(1, (os.cpu_count() or 4) // 2)
+    for var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+        os.environ.setdefault(var, str(nt))
+
+
+_configure_blas_threads()
+
+
+def _json_loads(raw: bytes) -> Any:
+    """Parse JSON bytes with orjson when available, stdlib otherwise."""
+
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw.decode("utf-8"))
+
+
+@functools.lru_cache(maxsize=None)
+def _audio_libs():
+    """Import numpy/soundfile on first use so --help and arg errors stay instant."""
+
+    try:
+        import numpy as np
+        import soundfile as sf
+    except ImportError as exc:
+        raise PipelineError(
+            "The `numpy` and `soundfile` packages are required for audio assembly. "
+            "Install them with `pip install numpy soundfile`."
+        ) from exc
+    return np, sf
+
+
+# slots=True drops the per-instance __dict__ (~200 B each): an hour of
+# speech yields thousands of segments that live for the whole run.
+@dataclass(slots=True)
 class TranscriptSegment:
     """A single Whisper segment with timing metadata."""
 
     start: float
     end: float
     text: str
+    # Per-word (start, end, text) triples when the backend provides
+    # word-level timestamps; None otherwise.
+    words: Optional[List[Tuple[float, float, str]]] = None
 
     @property
     def duration(self) -> float:
         return max(0.0, self.end - self.start)
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedSegment:
     """Represents a synthesized audio clip aligned to a transcript segment."""
 
@@ -78,43 +143,147 @@ class PipelineError(RuntimeError):
 
 
 def run_command(command: List[str], *, cwd: Optional[Path] = None) -> None:
-    """Execute a shell command, raising an informative error if it fails."""
+    """Execute a shell command, raising an informative error if it fails.
 
-    result = subprocess.run(command, cwd=cwd, check=False, capture_output=True, text=True)
-    if result.returncode != 0:
-        stderr = result.stderr.strip() or result.stdout
-        raise PipelineError(f"Command {' '.join(command)} failed: {stderr}")
+    stderr is streamed and only a bounded tail is retained, so chatty tools
+    like ffmpeg never buffer their full log in memory on long inputs.
+    """
 
+    proc = subprocess.Popen(
+        command,
+        cwd=cwd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+    )
+    tail: deque = deque(maxlen=200)
+    assert proc.stderr is not None
+    for line in proc.stderr:
+        tail.append(line)
+    if proc.wait() != 0:
+        raise PipelineError(f"Command {' '.join(command)} failed: {''.join(tail).strip()}")
 
-def extract_audio(input_video: Path, audio_output: Path) -> None:
-    """Extract the primary audio track from a video file using ffmpeg."""
 
-    print(f"[pipeline] Extracting audio from {input_video} -> {audio_output}")
+def _ffmpeg(args: List[str]) -> None:
+    """Run ffmpeg quietly with full threading enabled.
+
+    Audio filters like atempo are CPU-bound; `-threads 0` plus the filter
+    threading flags let them use every core instead of the defaults.
+    """
+
+    cpu_count = str(os.cpu_count() or 1)
     run_command(
         [
             "ffmpeg",
-            "-y",
-            "-i",
-            str(input_video),
-            "-q:a",
+            "-hide_banner",
+            "-nostats",
+            "-loglevel",
+            "error",
+            "-threads",
             "0",
-            "-map",
-            "a",
-            str(audio_output),
+            "-filter_threads",
+            cpu_count,
+            "-filter_complex_threads",
+            cpu_count,
+            "-y",
+            *args,
         ]
     )
 
 
+@functools.lru_cache(maxsize=1)
+def _pyav():
+    """Return the PyAV module, or None when it is not installed.
+
+    faster-whisper bundles PyAV (with its own FFmpeg libraries), so it is
+    normally present whenever that transcriber is; treat it as optional and
+    keep the ffmpeg CLI working without it.
+    """
+
+    try:
+        import av
+    except ImportError:
+        return None
+    return av
+
+
+def _extract_audio_pyav(
+    input_video: Path,
+    audio_output: Path,
+    *,
+    sample_rate: Optional[int] = None,
+    mono: bool = False,
+) -> bool:
+    """Decode the primary audio track in-process via PyAV.
+
+    Returns False when PyAV is unavailable or the container trips it up, in
+    which case the caller falls back to the ffmpeg CLI.
+    """
+
+    av = _pyav()
+    if av is None:
+        return False
+    try:
+        with av.open(str(input_video)) as source:
+            stream = next((s for s in source.streams if s.type == "audio"), None)
+            if stream is None:
+                raise PipelineError(f"No audio track found in {input_video}")
+            rate = sample_rate or stream.rate
+            layout = "mono" if mono else stream.layout.name
+            resampler = av.AudioResampler(format="s16", layout=layout, rate=rate)
+            with av.open(str(audio_output), "w") as sink:
+                out_stream = sink.add_stream("pcm_s16le", rate=rate)
+                for frame in source.decode(stream):
+                    for converted in resampler.resample(frame):
+                        sink.mux(out_stream.encode(converted))
+                sink.mux(out_stream.encode(None))
+        return True
+    except PipelineError:
+        raise
+    except Exception as exc:  # odd container/codec: let the CLI have a go
+        logger.warning("PyAV extraction failed (%s); falling back to ffmpeg CLI", exc)
+        audio_output.unlink(missing_ok=True)
+        return False
+
+
+def extract_audio(
+    input_video: Path,
+    audio_output: Path,
+    *,
+    sample_rate: Optional[int] = None,
+    mono: bool = False,
+) -> None:
+    """Extract the primary audio track from a video file.
+
+    Runs in-process through PyAV when available, skipping the fork+exec and
+    dynamic-library load an ffmpeg invocation costs; otherwise shells out.
+    When the track is only consumed by transcription, pass sample_rate/mono
+    to land directly in Whisper's 16 kHz mono format and skip every
+    downstream resample.
+    """
+
+    print(f"[pipeline] Extracting audio from {input_video} -> {audio_output}")
+    if _extract_audio_pyav(input_video, audio_output, sample_rate=sample_rate, mono=mono):
+        return
+    # -vn guarantees the video stream is never demuxed or decoded: the whole
+    # video-decode cost disappears, which beats any hwaccel offload of it.
+    command = ["-i", str(input_video), "-vn", "-map", "a", "-c:a", "pcm_s16le"]
+    if sample_rate:
+        command += ["-ar", str(sample_rate)]
+    if mono:
+        command += ["-ac", "1"]
+    _ffmpeg(command + [str(audio_output)])
+
+
 def synthesize_beep(output_path: Path, *, duration: float, frequency: int = 440, sample_rate: int = 22050) -> None:
     """Generate a simple sine beep WAV as a fallback using ffmpeg lavfi.
 
     This ensures the pipeline can proceed even if TTS fails or times out.
     """
     dur = max(0.2, float(duration))  # minimum 200ms to avoid zero-length
-    run_command(
+    _ffmpeg(
         [
-            "ffmpeg",
-            "-y",
             "-f",
             "lavfi",
             "-i",
@@ -128,6 +297,31 @@ def synthesize_beep(output_path: Path, *, duration: float, frequency: int = 440,
     )
 
 
+@functools.lru_cache(maxsize=2)
+def _load_openai_whisper_model(model_name: str, device: Optional[str]):
+    """Load (and cache) openai-whisper weights; load cost dominates short clips.
+
+    On CUDA the forward pass is torch.compile'd with a static KV cache once at
+    load, so the compile cost is shared by all cached uses.
+    """
+    import whisper  # type: ignore
+
+    model = whisper.load_model(model_name, device=device)
+    if (device or "").startswith("cuda"):
+        try:
+            import torch  # type: ignore
+
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.benchmark = True
+            gen_cfg = getattr(model, "generation_config", None)
+            if gen_cfg is not None and hasattr(gen_cfg, "cache_implementation"):
+                gen_cfg.cache_implementation = "static"
+            model.forward = torch.compile(model.forward, mode="reduce-overhead", fullgraph=True)
+        except Exception:
+            pass
+    return model
+
+
 def transcribe_with_openai_whisper(
     audio_path: Path,
     *,
@@ -135,8 +329,13 @@ def transcribe_with_openai_whisper(
     device: Optional[str] = None,
     temperature: float = 0.0,
     word_timestamps: bool = True,
+    audio_data: Optional[Any] = None,
 ) -> List[TranscriptSegment]:
-    """Transcribe using the original openai-whisper package."""
+    """Transcribe using the original openai-whisper package.
+
+    `audio_data` may carry an already-decoded 16 kHz mono float32 array so
+    the backend skips its own ffmpeg decode of the file.
+    """
     try:
         import whisper  # type: ignore
     except ImportError as exc:
@@ -146,9 +345,9 @@ def transcribe_with_openai_whisper(
         ) from exc
 
     print(f"[pipeline] Transcribing with openai-whisper model={model_name} device={device or 'auto'}")
-    model = whisper.load_model(model_name, device=device)
+    model = _load_openai_whisper_model(model_name, device)
     result = model.transcribe(
-        str(audio_path),
+        audio_data if audio_data is not None else str(audio_path),
         temperature=temperature,
         verbose=False,
         word_timestamps=word_timestamps,
@@ -166,6 +365,140 @@ def transcribe_with_openai_whisper(
     return segments
 
 
+# Serialises cache misses below: lru_cache does not deduplicate concurrent
+# callers, and two simultaneous WhisperModel constructions would double
+# transient memory for the heaviest object in the pipeline.
+_FW_LOAD_LOCK = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_fw_model_cached(model_name: str, ct2_device: str, ct2_compute: str):
+    from faster_whisper import WhisperModel  # type: ignore
+
+    print(f"[pipeline] Loading faster-whisper model={model_name} device={ct2_device} compute={ct2_compute}")
+    # cpu_threads sizes CTranslate2's intra-op pool; num_workers=2 lets it
+    # overlap encoder and decoder work on CPU.
+    return WhisperModel(
+        model_name,
+        device=ct2_device,
+        compute_type=ct2_compute,
+        cpu_threads=os.cpu_count() or 4,
+        num_workers=2,
+    )
+
+
+def _load_fw_model(model_name: str, ct2_device: str, ct2_compute: str):
+    """Load (and cache) a faster-whisper model keyed by (name, device, compute).
+
+    Weight load and CTranslate2 init cost seconds per call; CT2 models are
+    thread-safe for `.transcribe()`, so one cached instance serves retries in
+    `auto` mode and any batch driver importing this module. The lock makes a
+    caller racing the background preload wait for (and reuse) that load
+    instead of constructing a second copy of the weights.
+    """
+
+    with _FW_LOAD_LOCK:
+        return _load_fw_model_cached(model_name, ct2_device, ct2_compute)
+
+
+def _transcribe_via_server(
+    sock_path: str,
+    audio_path: Path,
+    *,
+    beam_size: int,
+    word_timestamps: bool,
+    language: Optional[str],
+    vad_filter: bool,
+    batch_size: Optional[int],
+) -> List[TranscriptSegment]:
+    """Ask a resident whisper_server.py process to transcribe the file.
+
+    One JSON request line per connection, one JSON reply. Raises OSError on
+    connection trouble (caller falls back to in-process transcription) and
+    PipelineError when the server itself reports a failure.
+    """
+
+    import socket
+
+    request = {
+        "path": str(audio_path),
+        "beam_size": beam_size,
+        "word_timestamps": word_timestamps,
+        "language": language,
+        "vad_filter": vad_filter,
+        "batch_size": batch_size,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(sock_path)
+        with client.makefile("rwb") as stream:
+            stream.write(json.dumps(request).encode("utf-8") + b"\n")
+            stream.flush()
+            line = stream.readline()
+    if not line:
+        raise PipelineError("whisper server closed the connection without replying")
+    payload = _json_loads(line)
+    if payload.get("error"):
+        raise PipelineError(f"whisper server error: {payload['error']}")
+    return [
+        TranscriptSegment(
+            start=float(item.get("start", 0.0)),
+            end=float(item.get("end", 0.0)),
+            text=str(item.get("text", "")).strip(),
+        )
+        for item in payload.get("segments", [])
+        if item.get("text")
+    ]
+
+
+def _fw_runtime(device: Optional[str], compute_type: Optional[str]) -> Tuple[str, str]:
+    """Resolve the CTranslate2 device/compute pair for faster-whisper.
+
+    int8_float16 on GPU is near-par with float16 in speed at lower VRAM;
+    int8 gives ~2x over fp32 on CPU.
+    """
+
+    dev = (device or "cpu").lower()
+    ct2_device = "cuda" if dev.startswith("cuda") else "cpu"
+    ct2_compute = compute_type or ("int8_float16" if ct2_device == "cuda" else "int8")
+    return ct2_device, ct2_compute
+
+
+def preload_fw_model_async(
+    model_name: str,
+    *,
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None,
+) -> Optional[threading.Thread]:
+    """Start loading the faster-whisper model on a background thread.
+
+    Weight load and CTranslate2 init take seconds; kicking them off while
+    ffmpeg extracts the audio hides that latency entirely. Failures are
+    swallowed here — the real transcription path reloads and reports them
+    properly. The later _load_fw_model call either hits the populated cache
+    or blocks on the load lock until this thread's construction finishes;
+    it never builds a duplicate model. When WHISPER_SERVER_SOCK points at a
+    resident server the preload is skipped entirely (returns None) — the
+    server owns the weights, and a local copy would burn hundreds of MB on
+    exactly the deployments server mode exists for. If the server later
+    turns out to be unreachable, the in-process fallback loads lazily.
+    """
+
+    if os.environ.get("WHISPER_SERVER_SOCK"):
+        return None
+
+    ct2_device, ct2_compute = _fw_runtime(device, compute_type)
+
+    def _load() -> None:
+        try:
+            _load_fw_model(model_name, ct2_device, ct2_compute)
+        except Exception as exc:
+            logger.debug("faster-whisper preload failed (deferred to transcription): %s", exc)
+
+    thread = threading.Thread(target=_load, name="fw-preload", daemon=True)
+    thread.start()
+    return thread
+
+
 def transcribe_with_faster_whisper(
     audio_path: Path,
     *,
@@ -175,43 +508,279 @@ def transcribe_with_faster_whisper(
     beam_size: int = 5,
     word_timestamps: bool = True,
     language: Optional[str] = None,
+    vad_filter: bool = True,
+    batch_size: Optional[int] = None,
+    audio_data: Optional[Any] = None,
 ) -> List[TranscriptSegment]:
     """Transcribe using faster-whisper (CTranslate2 backend)."""
     try:
-        from faster_whisper import WhisperModel  # type: ignore
+        import faster_whisper  # type: ignore # noqa: F401
     except ImportError as exc:
         raise PipelineError(
             "faster-whisper is not installed. Install with `pip install faster-whisper`."
         ) from exc
 
-    # Map device
-    dev = (device or "cpu").lower()
-    ct2_device = "cuda" if dev.startswith("cuda") else "cpu"
-    ct2_compute = compute_type or ("float16" if ct2_device == "cuda" else "int8")
+    segments = list(
+        iter_faster_whisper_segments(
+            audio_path,
+            model_name=model_name,
+            device=device,
+            compute_type=compute_type,
+            beam_size=beam_size,
+            word_timestamps=word_timestamps,
+            language=language,
+            vad_filter=vad_filter,
+            batch_size=batch_size,
+            audio_data=audio_data,
+        )
+    )
+    print(f"[pipeline] Transcription done: {len(segments)} segments")
+    if not segments:
+        raise PipelineError(
+            "faster-whisper produced no transcript segments. Check audio quality or choose a larger model."
+        )
+    return segments
 
-    print(f"[pipeline] Loading faster-whisper model={model_name} device={ct2_device} compute={ct2_compute}")
-    model = WhisperModel(model_name, device=ct2_device, compute_type=ct2_compute)
+
+def iter_faster_whisper_segments(
+    audio_path: Path,
+    *,
+    model_name: str,
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None,
+    beam_size: int = 5,
+    word_timestamps: bool = True,
+    language: Optional[str] = None,
+    vad_filter: bool = True,
+    batch_size: Optional[int] = None,
+    audio_data: Optional[Any] = None,
+):
+    """Yield TranscriptSegments as faster-whisper decodes them.
+
+    Whisper emits segments incrementally; yielding them lazily lets a
+    downstream consumer (TTS) start while decoding is still running instead
+    of blocking on the full transcript.
+    """
+
+    server_sock = os.environ.get("WHISPER_SERVER_SOCK")
+    if server_sock and Path(server_sock).exists():
+        try:
+            yield from _transcribe_via_server(
+                server_sock,
+                audio_path,
+                beam_size=beam_size,
+                word_timestamps=word_timestamps,
+                language=language,
+                vad_filter=vad_filter,
+                batch_size=batch_size,
+            )
+            return
+        except OSError as exc:
+            logger.warning("whisper server unreachable (%s); transcribing in-process", exc)
+
+    try:
+        import faster_whisper  # type: ignore # noqa: F401
+    except ImportError as exc:
+        raise PipelineError(
+            "faster-whisper is not installed. Install with `pip install faster-whisper`."
+        ) from exc
+
+    ct2_device, ct2_compute = _fw_runtime(device, compute_type)
+    model = _load_fw_model(model_name, ct2_device, ct2_compute)
     print("[pipeline] Model loaded. Starting transcription...")
-    segments_iter, _info = model.transcribe(
-        str(audio_path),
+    transcribe_kwargs = dict(
         beam_size=beam_size,
         word_timestamps=word_timestamps,
         language=language,
-        vad_filter=True,
-    )
-    print("[pipeline] Processing segments...")
-    segments_list = list(segments_iter)
-    print(f"[pipeline] Transcription done: {len(segments_list)} segments")
-    segments: List[TranscriptSegment] = [
-        TranscriptSegment(start=float(getattr(seg, "start", 0.0)), end=float(getattr(seg, "end", 0.0)), text=str(getattr(seg, "text", "")).strip())
-        for seg in segments_list
-        if getattr(seg, "text", None)
-    ]
-    if not segments:
+        vad_filter=vad_filter,
+        vad_parameters={"min_silence_duration_ms": 500} if vad_filter else None,
+    )
+    # Batched decoding keeps the GPU fed; ~3-4x on faster-whisper >= 1.1.
+    if batch_size is None:
+        batch_size = int(os.environ.get("WHISPER_BATCH", "8"))
+    source = audio_data if audio_data is not None else str(audio_path)
+    if batch_size > 1:
+        try:
+            from faster_whisper import BatchedInferencePipeline  # type: ignore
+
+            print(f"[pipeline] Using BatchedInferencePipeline batch_size={batch_size}")
+            pipeline = BatchedInferencePipeline(model=model)
+            segments_iter, _info = pipeline.transcribe(
+                source, batch_size=batch_size, **transcribe_kwargs
+            )
+        except (ImportError, AttributeError):  # faster-whisper < 1.1
+            segments_iter, _info = model.transcribe(source, **transcribe_kwargs)
+    else:
+        segments_iter, _info = model.transcribe(source, **transcribe_kwargs)
+    for seg in segments_iter:
+        if getattr(seg, "text", None):
+            word_list = [
+                (float(word.start), float(word.end), str(word.word).strip())
+                for word in (getattr(seg, "words", None) or [])
+                if str(getattr(word, "word", "")).strip()
+            ]
+            yield TranscriptSegment(
+                start=float(getattr(seg, "start", 0.0)),
+                end=float(getattr(seg, "end", 0.0)),
+                text=str(getattr(seg, "text", "")).strip(),
+                words=word_list or None,
+            )
+
+
+def detect_speech_intervals(
+    audio_path: Path,
+    *,
+    silence_db: float = -35.0,
+    min_silence: float = 0.6,
+) -> List[Tuple[float, float]]:
+    """Find speech intervals using ffmpeg's silencedetect filter.
+
+    Silence runs below `silence_db` lasting at least `min_silence` seconds are
+    treated as boundaries; the complement of those runs is returned as
+    (start, end) speech intervals covering the file.
+    """
+
+    result = subprocess.run(
+        [
+            "ffmpeg",
+            "-i",
+            str(audio_path),
+            "-af",
+            f"silencedetect=noise={silence_db}dB:d={min_silence}",
+            "-f",
+            "null",
+            "-",
+        ],
+        check=False,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise PipelineError(f"silencedetect failed: {result.stderr.strip()[-500:]}")
+
+    _, sf = _audio_libs()
+    total_duration = sf.info(str(audio_path)).duration
+    silences: List[Tuple[float, float]] = []
+    silence_start: Optional[float] = None
+    for line in result.stderr.splitlines():
+        if "silence_start:" in line:
+            try:
+                silence_start = float(line.rsplit("silence_start:", 1)[1].strip().split()[0])
+            except (ValueError, IndexError):
+                silence_start = None
+        elif "silence_end:" in line and silence_start is not None:
+            try:
+                silence_end = float(line.rsplit("silence_end:", 1)[1].strip().split()[0])
+            except (ValueError, IndexError):
+                continue
+            silences.append((silence_start, silence_end))
+            silence_start = None
+    if silence_start is not None:
+        silences.append((silence_start, total_duration))
+
+    intervals: List[Tuple[float, float]] = []
+    cursor = 0.0
+    for start, end in silences:
+        if start - cursor > 0.05:
+            intervals.append((cursor, start))
+        cursor = end
+    if total_duration - cursor > 0.05:
+        intervals.append((cursor, total_duration))
+    return intervals or [(0.0, total_duration)]
+
+
+def transcribe_parallel_faster_whisper(
+    audio_path: Path,
+    *,
+    model_name: str,
+    device: Optional[str] = None,
+    compute_type: Optional[str] = None,
+    beam_size: int = 5,
+    word_timestamps: bool = True,
+    language: Optional[str] = None,
+    workers: int = 2,
+    workdir: Optional[Path] = None,
+    silence_db: float = -35.0,
+    min_silence: float = 0.6,
+) -> List[TranscriptSegment]:
+    """VAD-split the audio and transcribe the speech chunks concurrently.
+
+    One faster-whisper model serves all chunks: CTranslate2 releases the GIL
+    during inference, so a thread pool scales throughput with CPU cores while
+    idle gaps between speech never reach the model at all. Chunk timestamps
+    are shifted back by each chunk's start offset before merging.
+    """
+
+    try:
+        import faster_whisper  # type: ignore # noqa: F401
+    except ImportError as exc:
+        raise PipelineError(
+            "faster-whisper is not installed. Install with `pip install faster-whisper`."
+        ) from exc
+
+    intervals = detect_speech_intervals(audio_path, silence_db=silence_db, min_silence=min_silence)
+    if len(intervals) <= 1:
+        return transcribe_with_faster_whisper(
+            audio_path,
+            model_name=model_name,
+            device=device,
+            compute_type=compute_type,
+            beam_size=beam_size,
+            word_timestamps=word_timestamps,
+            language=language,
+        )
+
+    ct2_device, ct2_compute = _fw_runtime(device, compute_type)
+    print(f"[pipeline] Transcribing {len(intervals)} speech chunks with {workers} workers")
+    model = _load_fw_model(model_name, ct2_device, ct2_compute)
+
+    chunk_dir = workdir or audio_path.parent
+
+    def _transcribe_chunk(index: int, start: float, end: float) -> List[TranscriptSegment]:
+        chunk_path = chunk_dir / f"vad_chunk_{index:04d}.wav"
+        _ffmpeg(
+            [
+                "-ss",
+                f"{start:.3f}",
+                "-t",
+                f"{end - start:.3f}",
+                "-i",
+                str(audio_path),
+                "-c",
+                "copy",
+                str(chunk_path),
+            ]
+        )
+        segments_iter, _info = model.transcribe(
+            str(chunk_path),
+            beam_size=beam_size,
+            word_timestamps=word_timestamps,
+            language=language,
+            vad_filter=False,  # the split already removed silence
+        )
+        return [
+            TranscriptSegment(
+                start=start + float(getattr(seg, "start", 0.0)),
+                end=start + float(getattr(seg, "end", 0.0)),
+                text=str(getattr(seg, "text", "")).strip(),
+            )
+            for seg in segments_iter
+            if getattr(seg, "text", None)
+        ]
+
+    merged: List[TranscriptSegment] = []
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(intervals)))) as executor:
+        futures = [
+            executor.submit(_transcribe_chunk, i, start, end)
+            for i, (start, end) in enumerate(intervals)
+        ]
+        for future in futures:  # in submission order so segments stay sorted
+            merged.extend(future.result())
+    if not merged:
         raise PipelineError(
             "faster-whisper produced no transcript segments. Check audio quality or choose a larger model."
         )
-    return segments
+    return merged
 
 
 def transcribe_with_whisper_cpp(
@@ -222,8 +791,25 @@ def transcribe_with_whisper_cpp(
     workdir: Optional[Path] = None,
     language: Optional[str] = None,
     threads: Optional[int] = None,
+    quant: Optional[str] = None,
+    processors: Optional[int] = None,
 ) -> List[TranscriptSegment]:
-    """Transcribe using whisper.cpp CLI (requires compiled binary and ggml model)."""
+    """Transcribe using whisper.cpp CLI (requires compiled binary and ggml model).
+
+    Throughput on CPU scales roughly linearly with threads up to the
+    physical-core count, so `-t` defaults to half the logical cores when not
+    given, and decoding is greedy by default (beam search buys little on
+    conversational dialogue). `processors` maps to whisper.cpp's `-p`,
+    which splits the audio into P time slices decoded in parallel against
+    one shared weight copy — nearly halves wall time on long inputs, at a
+    small accuracy cost at slice boundaries, so it defaults to 1. When
+    raising it, keep `threads * processors` within the physical-core
+    count. `quant` picks a quantized sibling of the model
+    (e.g. ggml-small-q5_0.bin for quant='q5_0'): ~40% less RAM at near-par
+    accuracy. For best results build whisper.cpp against a BLAS backend
+    (GGML_BLAS/OpenBLAS on Linux, Accelerate/Metal on macOS); CUDA builds
+    additionally take `-ngl N` via WHISPER_CPP_EXTRA_ARGS for GPU offload.
+    """
     bin_path = binary_path
     if not bin_path:
         env_candidate = os.environ.get("WHISPER_CPP_BIN")
@@ -238,6 +824,13 @@ def transcribe_with_whisper_cpp(
     if not bin_path or not Path(bin_path).exists():
         raise PipelineError("whisper.cpp binary not found. Set --whisper-cpp-bin or WHISPER_CPP_BIN.")
 
+    if quant:
+        quant_path = model_path.with_name(f"{model_path.stem}-{quant}{model_path.suffix}")
+        if quant_path.exists():
+            model_path = quant_path
+        else:
+            logger.warning("Quantized model %s not found; using %s", quant_path, model_path)
+
     if not model_path.exists():
         raise PipelineError(f"whisper.cpp model not found: {model_path}")
 
@@ -253,8 +846,19 @@ def transcribe_with_whisper_cpp(
     ]
     if language:
         cmd += ["-l", language]
-    if threads and threads > 0:
-        cmd += ["-t", str(threads)]
+    if not processors or processors <= 0:
+        processors = max(1, int(os.environ.get("WHISPER_CPP_PROCS", "1")))
+    if not threads or threads <= 0:
+        # Physical cores (~logical/2 with SMT); extra SMT threads hurt here.
+        # With -p > 1 each processor gets its own thread pool, so divide.
+        threads = max(1, (os.cpu_count() or 2) // 2 // processors)
+    cmd += ["-t", str(threads), "-p", str(processors)]
+    cmd += ["-bs", os.environ.get("WHISPER_CPP_BEAM", "1"), "-bo", os.environ.get("WHISPER_CPP_BEST_OF", "1")]
+    if os.environ.get("WHISPER_CPP_FLASH_ATTN", "1") != "0":
+        cmd.append("--flash-attn")
+    extra_args = os.environ.get("WHISPER_CPP_EXTRA_ARGS")
+    if extra_args:
+        cmd += extra_args.split()
 
     timeout_sec = max(30, int(os.environ.get("WHISPER_CPP_TIMEOUT", "120")))
     try:
@@ -278,6 +882,10 @@ def transcribe_with_whisper_cpp(
             raise PipelineError(
                 f"whisper.cpp fallback failed: {result.stderr.strip() or result.stdout.strip()}"
             )
+    if result.returncode != 0 and "--flash-attn" in cmd:
+        # Older binaries predate the flag; retry once without it.
+        retry_cmd = [arg for arg in cmd if arg != "--flash-attn"]
+        result = subprocess.run(retry_cmd, check=False, capture_output=True, text=True, timeout=timeout_sec)
     if result.returncode != 0:
         raise PipelineError(f"whisper.cpp failed: {result.stderr or result.stdout}")
 
@@ -291,11 +899,10 @@ def transcribe_with_whisper_cpp(
         raise PipelineError("whisper.cpp did not produce a JSON transcript")
 
     try:
-        data = json.loads(json_path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
+        data = _json_loads(json_path.read_bytes())
+    except ValueError as exc:
         raise PipelineError(f"Failed to parse whisper.cpp JSON: {exc}") from exc
 
-    segments: List[TranscriptSegment] = []
     items: Any
     if isinstance(data, dict):
         items = data.get("segments") or data.get("result") or []
@@ -308,15 +915,20 @@ def transcribe_with_whisper_cpp(
         items = list(items)
     if not isinstance(items, list):
         items = []
-    for seg in items:
-        try:
-            start = float(seg.get("start", 0.0))
-            end = float(seg.get("end", 0.0))
-            text = str(seg.get("text", "")).strip()
-            if text:
-                segments.append(TranscriptSegment(start=start, end=end, text=text))
-        except Exception:
-            continue
+    # Shape-check up front so the bulk comprehension runs without per-item
+    # exception handling; thousands of segments make that overhead visible.
+    try:
+        segments = [
+            TranscriptSegment(
+                start=float(seg.get("start", 0.0)),
+                end=float(seg.get("end", 0.0)),
+                text=str(seg.get("text", "")).strip(),
+            )
+            for seg in items
+            if isinstance(seg, dict) and str(seg.get("text", "")).strip()
+        ]
+    except (TypeError, ValueError) as exc:
+        raise PipelineError(f"Malformed whisper.cpp segment data: {exc}") from exc
     if not segments:
         raise PipelineError("whisper.cpp produced no transcript segments")
     return segments
@@ -338,12 +950,61 @@ def transcribe_audio(
     whisper_cpp_model: Optional[Path] = None,
     whisper_cpp_threads: Optional[int] = None,
     language: Optional[str] = None,
+    vad_parallel_workers: Optional[int] = None,
+    vad_filter: bool = True,
+    ct2_batch_size: Optional[int] = None,
+    whisper_cpp_quant: Optional[str] = None,
+    whisper_processors: Optional[int] = None,
+    vad_silence_db: float = -35.0,
+    vad_min_silence: float = 0.6,
 ) -> List[TranscriptSegment]:
-    """Transcribe an audio file using the selected backend and return time-aligned segments."""
+    """Transcribe an audio file using the selected backend and return time-aligned segments.
+
+    ``whisper_processors`` requests a P-way time split: whisper.cpp decodes
+    P slices in-process via ``-p``, while faster-whisper gets the same
+    effect through the silence-split parallel path when
+    ``vad_parallel_workers`` was not set explicitly.
+    """
 
     backend = (transcriber or "auto").lower()
     print(f"[pipeline] Starting transcription via {backend} (whisper_model={model_name}, device={device or ct2_device or 'auto'})")
+
+    # Decode the track once and share the array across backends, so the
+    # auto-fallback chain does not re-decode the file per attempt. Only a
+    # 16 kHz mono extraction qualifies; anything else lets the backend
+    # decode/resample itself.
+    _decoded: List[Any] = [None, False]
+
+    def _audio_array() -> Optional[Any]:
+        if not _decoded[1]:
+            _decoded[1] = True
+            try:
+                _, sf = _audio_libs()
+                data, sr = sf.read(str(audio_path), dtype="float32")
+                if sr == 16000:
+                    if getattr(data, "ndim", 1) > 1:
+                        data = data.mean(axis=1)
+                    _decoded[0] = data
+            except (PipelineError, RuntimeError):
+                _decoded[0] = None
+        return _decoded[0]
     if backend in ("faster-whisper", "faster_whisper"):
+        if not vad_parallel_workers and whisper_processors and whisper_processors > 1:
+            vad_parallel_workers = whisper_processors
+        if vad_parallel_workers and vad_parallel_workers > 1:
+            return transcribe_parallel_faster_whisper(
+                audio_path,
+                model_name=model_name,
+                device=ct2_device or device,
+                compute_type=ct2_compute,
+                beam_size=max(1, int(ct2_beam_size)),
+                word_timestamps=word_timestamps,
+                language=language,
+                workers=vad_parallel_workers,
+                workdir=workdir,
+                silence_db=vad_silence_db,
+                min_silence=vad_min_silence,
+            )
         return transcribe_with_faster_whisper(
             audio_path,
             model_name=model_name,
@@ -352,6 +1013,9 @@ def transcribe_audio(
             beam_size=max(1, int(ct2_beam_size)),
             word_timestamps=word_timestamps,
             language=language,
+            vad_filter=vad_filter,
+            batch_size=ct2_batch_size,
+            audio_data=_audio_array(),
         )
     elif backend == "whisper":
         return transcribe_with_openai_whisper(
@@ -360,6 +1024,7 @@ def transcribe_audio(
             device=device,
             temperature=temperature,
             word_timestamps=word_timestamps,
+            audio_data=_audio_array(),
         )
     elif backend in ("whisper-cpp", "whisper_cpp"):
         env_bin = Path(os.environ.get("WHISPER_CPP_BIN", "")) if os.environ.get("WHISPER_CPP_BIN") else None  # Fixed: Safe Path
@@ -377,6 +1042,8 @@ def transcribe_audio(
             workdir=workdir,
             language=language,
             threads=threads,
+            quant=whisper_cpp_quant or os.environ.get("WHISPER_CPP_QUANT"),
+            processors=whisper_processors,
         )
     elif backend == "auto":
         # Try faster-whisper first, then fall back to other implementations
@@ -388,6 +1055,9 @@ def transcribe_audio(
                 compute_type=ct2_compute,
                 beam_size=max(1, int(ct2_beam_size)),
                 word_timestamps=word_timestamps,
+                vad_filter=vad_filter,
+                batch_size=ct2_batch_size,
+                audio_data=_audio_array(),
             )
         except PipelineError:
             # Optionally try whisper.cpp if CLI args or env vars are configured
@@ -406,6 +1076,8 @@ def transcribe_audio(
                         workdir=workdir,
                         language=language,
                         threads=threads,
+                        quant=whisper_cpp_quant or os.environ.get("WHISPER_CPP_QUANT"),
+                        processors=whisper_processors,
                     )
                 except PipelineError:
                     pass
@@ -415,6 +1087,7 @@ def transcribe_audio(
                 device=device,
                 temperature=temperature,
                 word_timestamps=word_timestamps,
+                audio_data=_audio_array(),
             )
     else:
         raise PipelineError(
@@ -423,19 +1096,205 @@ def transcribe_audio(
 
 
 def write_transcript(segments: Iterable[TranscriptSegment], output_path: Path) -> None:
-    """Persist transcript data as JSON for later inspection or reuse."""
+    """Persist transcript data as JSON for later inspection or reuse.
 
-    serialisable = [
-        {"start": seg.start, "end": seg.end, "text": seg.text}
-        for seg in segments
-    ]
-    output_path.write_text(json.dumps(serialisable, indent=2), encoding="utf-8")
+    Segments are serialised one element at a time straight to the file, so
+    peak memory stays constant no matter how long the transcript is —
+    building the full document string for a multi-hour recording would
+    otherwise double the working set. Accepts any iterable, including a
+    live transcription stream.
+    """
+
+    dumps = (lambda obj: orjson.dumps(obj)) if orjson is not None else (
+        lambda obj: json.dumps(obj, ensure_ascii=False).encode("utf-8")
+    )
+    with output_path.open("wb") as handle:
+        handle.write(b"[")
+        prefix = b"\n  "
+        for seg in segments:
+            handle.write(prefix + dumps({"start": seg.start, "end": seg.end, "text": seg.text}))
+            prefix = b",\n  "
+        handle.write(b"\n]" if prefix != b"\n  " else b"]")
+        handle.write(b"\n")
+
+
+def coalesce_segments(
+    segments: Iterable[TranscriptSegment],
+    *,
+    max_duration: float = 12.0,
+    max_gap: float = 0.3,
+):
+    """Merge adjacent short segments into fewer, longer TTS calls.
+
+    Whisper routinely emits runs of sub-2-second segments, and every one
+    pays Chatterbox's fixed per-call cost (tokenizer, text encoder, prefix
+    KV). Neighbours separated by less than ``max_gap`` seconds are folded
+    together while the combined span stays under ``max_duration``; the
+    merged clip is later stretched against the merged target duration, so
+    pacing is preserved. Lazy, so a streamed transcript keeps flowing.
+    """
+
+    pending: Optional[TranscriptSegment] = None
+    for segment in segments:
+        if pending is None:
+            pending = segment
+            continue
+        gap = segment.start - pending.end
+        if gap <= max_gap and segment.end - pending.start <= max_duration:
+            merged_words = (pending.words or []) + (segment.words or [])
+            pending = TranscriptSegment(
+                start=pending.start,
+                end=max(pending.end, segment.end),
+                text=f"{pending.text} {segment.text}".strip(),
+                words=merged_words or None,
+            )
+            continue
+        yield pending
+        pending = segment
+    if pending is not None:
+        yield pending
+
+
+def _link_or_copy(src: str, dst: str) -> None:
+    """Hard-link when source and destination share a filesystem, else copy.
+
+    A link is a metadata-only operation; the copyfile fallback (EXDEV,
+    existing destination, no-hardlink filesystems) still goes through
+    sendfile/copy_file_range in the kernel without buffering in Python.
+    """
+
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
 
 
 def find_python() -> str:
     return os.environ.get("PYTHON_BIN", "python3")
 
 
+_TTS_CACHE_DIR = Path.home() / ".cache" / "famflix" / "tts"
+
+
+def _hash_file(path: Path) -> str:
+    """Return the sha256 hex digest of a file, read in 1 MiB blocks."""
+
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def tts_cache_path(text: str, *, prompt_digest: str, params_sig: str) -> Path:
+    """Map (text, voice prompt, synthesis params) to an on-disk cache entry.
+
+    Transcripts repeat short utterances ('yeah', 'okay') constantly; a hit
+    here skips the Chatterbox forward pass entirely and costs one hard link.
+    """
+
+    key = hashlib.sha256(f"{text}\0{prompt_digest}\0{params_sig}".encode()).hexdigest()
+    return _TTS_CACHE_DIR / f"{key}.wav"
+
+
+def tts_cache_store(raw_clip: Path, cached_wav: Path) -> None:
+    """Insert a synthesized clip into the TTS cache, best-effort.
+
+    The scratch workdir usually lives on tmpfs while the cache is on the
+    real filesystem, so a bare hard link would fail with EXDEV on every
+    insert; _link_or_copy handles the cross-device case. The copy lands
+    under a temporary name and is renamed into place so a concurrent run
+    never reads a half-written entry.
+    """
+
+    staging = cached_wav.with_name(f"{cached_wav.name}.{os.getpid()}.tmp")
+    try:
+        _TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _link_or_copy(str(raw_clip), str(staging))
+        os.replace(str(staging), str(cached_wav))
+    except OSError:
+        staging.unlink(missing_ok=True)  # cache is best-effort
+
+
+def _prepare_prompt_tensor(audio_prompt: Path, workdir: Path) -> Optional[Path]:
+    """Decode and resample the speaker prompt once for the one-shot CLI path.
+
+    Each CLI invocation re-decodes and resamples --speaker-wav; saving the
+    prompt as a tensor lets every call load it with torch.load instead.
+    Returns None (callers keep passing the WAV) when torch/torchaudio are
+    unavailable or decoding fails.
+    """
+
+    try:
+        import torch
+        import torchaudio
+    except ImportError:
+        return None
+    try:
+        wav, sr = torchaudio.load(str(audio_prompt))
+        if wav.shape[0] > 1:
+            wav = wav.mean(dim=0, keepdim=True)
+        target_sr = 24000  # Chatterbox's native rate; the CLI re-resamples if its model differs
+        if int(sr) != target_sr:
+            wav = torchaudio.functional.resample(wav, int(sr), target_sr)
+        tensor_path = workdir / "prompt.pt"
+        torch.save({"wav": wav, "sr": target_sr}, str(tensor_path))
+        return tensor_path
+    except Exception as exc:
+        logger.debug("Prompt tensor preparation failed; using WAV prompt: %s", exc)
+        return None
+
+
+def _run_tts_cli(cmd: List[str], *, env: dict, timeout_sec: int) -> Tuple[int, str, str]:
+    """Run the one-shot TTS CLI without buffering its full output in memory.
+
+    A verbose Chatterbox run can emit megabytes of progress; captured pipes
+    would hold all of it and stall once the buffer fills. stdout is consumed
+    line-by-line keeping only a short tail (the JSON metadata is the final
+    line) while stderr drains on a side thread into a ring buffer for error
+    reporting. Raises subprocess.TimeoutExpired when the deadline passes.
+    """
+
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        env=env,
+    )
+    stderr_tail: deque = deque(maxlen=50)
+
+    def _drain_stderr() -> None:
+        assert proc.stderr is not None
+        for line in proc.stderr:
+            stderr_tail.append(line)
+
+    drain = threading.Thread(target=_drain_stderr, daemon=True)
+    drain.start()
+
+    timed_out = threading.Event()
+
+    def _kill() -> None:
+        timed_out.set()
+        proc.kill()
+
+    timer = threading.Timer(timeout_sec, _kill)
+    timer.start()
+    stdout_tail: deque = deque(maxlen=5)
+    try:
+        assert proc.stdout is not None
+        for line in proc.stdout:
+            stdout_tail.append(line)
+        returncode = proc.wait()
+    finally:
+        timer.cancel()
+    drain.join(timeout=1)
+    if timed_out.is_set():
+        raise subprocess.TimeoutExpired(cmd, timeout_sec)
+    return returncode, "".join(stdout_tail), "".join(stderr_tail)
+
+
 def chatterbox_tts(
     *,
     text: str,
@@ -449,8 +1308,13 @@ def chatterbox_tts(
     allow_fallback: bool = False,  # Added: Flag to tolerate beeps
     timeout_override: Optional[int] = None,
     verbose: bool = False,  # Added: Propagate verbose
-) -> None:
-    """Call the local Chatterbox CLI wrapper to synthesize speech and save the audio clip."""
+    speaker_tensor: Optional[Path] = None,
+) -> Optional[float]:
+    """Call the local Chatterbox CLI wrapper to synthesize speech and save the audio clip.
+
+    Returns the clip duration in seconds when the CLI reports it, so callers
+    need not probe the written file.
+    """
     python_bin = find_python()
     script_path = Path(__file__).parent / "chatterbox_tts.py"
     cmd: List[str] = [
@@ -465,6 +1329,8 @@ def chatterbox_tts(
         "--device",
         device,
     ]
+    if speaker_tensor is not None:
+        cmd.extend(["--speaker-tensor", str(speaker_tensor)])
     # Optional generation tuning
     steps_env = os.environ.get("CHATTERBOX_STEPS")
     if steps_env and steps_env.isdigit():
@@ -495,7 +1361,7 @@ def chatterbox_tts(
 
     timeout_sec = int(timeout_override or os.environ.get("CHATTERBOX_TIMEOUT", "120"))
     try:
-        result = subprocess.run(cmd, check=False, capture_output=True, text=True, env=env, timeout=timeout_sec)
+        returncode, stdout_text, stderr_text = _run_tts_cli(cmd, env=env, timeout_sec=timeout_sec)
     except subprocess.TimeoutExpired as e1:
         # Fallback: retry with adaptive smaller/safer settings (text len-based)
         text_len = max(1, len(text.strip()))
@@ -515,29 +1381,240 @@ def chatterbox_tts(
         else:
             fallback.extend(["--max-new-tokens", str(fallback_tokens)])
         try:
-            result = subprocess.run(fallback, check=False, capture_output=True, text=True, env=env, timeout=max(90, timeout_sec // 2))
+            returncode, stdout_text, stderr_text = _run_tts_cli(
+                fallback, env=env, timeout_sec=max(90, timeout_sec // 2)
+            )
         except subprocess.TimeoutExpired as e2:
             raise PipelineError(f"Chatterbox CLI timed out: initial={timeout_sec}s, fallback={max(90, timeout_sec // 2)}s") from e2
-    if result.returncode != 0:
-        raise PipelineError(f"Chatterbox CLI failed: {result.stderr or result.stdout}")
+    if returncode != 0:
+        raise PipelineError(f"Chatterbox CLI failed: {stderr_text or stdout_text}")
     # Parse JSON line to report whether the prompt was used and check for fallback
     try:
-        last_line = (result.stdout or "").strip().splitlines()[-1]
+        last_line = stdout_text.strip().splitlines()[-1] if stdout_text.strip() else ""
         meta = json.loads(last_line) if last_line else {}
         used = meta.get("used_prompt_arg")
         norm = meta.get("normalized_prompt_path")
         note = meta.get("note")
         if used is not None:
-            logging.info(f"[chatterbox] used_prompt_arg={used} normalized_prompt_path={norm}")
+            logger.info("[chatterbox] used_prompt_arg=%s normalized_prompt_path=%s", used, norm)
         if note == "fallback_beep_audio" and not allow_fallback:  # Fixed: Detect and raise on beep
             raise PipelineError(f"Chatterbox fell back to beep audio (note: {note}). Check CLI verbose output.")
+        duration = meta.get("duration_sec")
+        return float(duration) if duration is not None else None
     except json.JSONDecodeError:
         # Non-fatal if CLI output wasn't JSON
-        pass
+        return None
+
+
+class ChatterboxWorker:
+    """A long-lived ``chatterbox_tts.py --serve`` subprocess.
+
+    Spawning the CLI per utterance pays interpreter startup plus a full model
+    load for every segment. The serve mode keeps the model resident and speaks
+    newline-delimited JSON over stdin/stdout, so N segments cost one load plus
+    N forward passes. A lock serialises request/response pairs because the
+    worker handles one request at a time.
+    """
+
+    def __init__(
+        self,
+        *,
+        speaker_wav: Path,
+        device: str = "cpu",
+        multilingual: bool = False,
+        language: Optional[str] = None,
+        exaggeration: Optional[float] = None,
+        cfg_weight: Optional[float] = None,
+        verbose: bool = False,
+    ) -> None:
+        python_bin = find_python()
+        script_path = Path(__file__).parent / "chatterbox_tts.py"
+        cmd: List[str] = [
+            python_bin,
+            str(script_path),
+            "--serve",
+            "--speaker-wav",
+            str(speaker_wav),
+            "--device",
+            device,
+        ]
+        steps_env = os.environ.get("CHATTERBOX_STEPS")
+        if steps_env and steps_env.isdigit():
+            cmd.extend(["--steps", steps_env])
+        attn_impl = os.environ.get("CHATTERBOX_ATTN_IMPL")
+        if attn_impl:
+            cmd.extend(["--attn-impl", attn_impl])
+        max_new_tokens = os.environ.get("CHATTERBOX_MAX_NEW_TOKENS")
+        if max_new_tokens and max_new_tokens.isdigit():
+            cmd.extend(["--max-new-tokens", max_new_tokens])
+        if multilingual:
+            cmd.append("--multilingual")
+        if language:
+            cmd.extend(["--language", language])
+        if exaggeration is not None:
+            cmd.extend(["--exaggeration", str(exaggeration)])
+        if cfg_weight is not None:
+            cmd.extend(["--cfg-weight", str(cfg_weight)])
+        if verbose:
+            cmd.append("--verbose")
+
+        env = os.environ.copy()
+        env.setdefault("DIFFUSERS_DISABLE_PROGRESS_BARS", "1")
+        env.setdefault("HF_HUB_DISABLE_PROGRESS_BARS", "1")
+        env.setdefault("TRANSFORMERS_VERBOSITY", "error")
+        env.setdefault("PYTHONWARNINGS", "ignore::FutureWarning")
+
+        self._proc = subprocess.Popen(
+            cmd,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=None if verbose else subprocess.DEVNULL,
+            text=True,
+            env=env,
+        )
+        self._lock = threading.Lock()
+
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def synthesize(self, *, text: str, output_path: Path) -> dict:
+        """Send one synthesis request and return the worker's JSON response."""
+        request = json.dumps({"text": text, "out": str(output_path)})
+        with self._lock:
+            if not self.alive():
+                raise PipelineError("Chatterbox worker process has exited.")
+            try:
+                assert self._proc.stdin is not None and self._proc.stdout is not None
+                self._proc.stdin.write(request + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except (BrokenPipeError, OSError) as exc:
+                raise PipelineError(f"Chatterbox worker pipe failed: {exc}") from exc
+        if not line:
+            raise PipelineError("Chatterbox worker closed its stdout (crashed?).")
+        try:
+            response = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise PipelineError(f"Chatterbox worker sent invalid JSON: {line!r}") from exc
+        if response.get("error"):
+            raise PipelineError(f"Chatterbox worker error: {response['error']}")
+        return response
+
+    # Bounded so a full batch of requests and replies always fits the pipe
+    # buffers without a reader running, avoiding write/write deadlock.
+    _PIPELINE_CHUNK = 32
+
+    def synthesize_many(self, requests: List[dict]) -> List[dict]:
+        """Stream a list of requests and return the responses in order.
+
+        All request lines in a chunk are written before any reply is read, so
+        the worker always has the next segment queued instead of stalling on
+        a full round trip per utterance. Per-segment failures are returned in
+        their response dicts; only transport errors raise.
+        """
+
+        responses: List[dict] = []
+        for start in range(0, len(requests), self._PIPELINE_CHUNK):
+            chunk = requests[start : start + self._PIPELINE_CHUNK]
+            with self._lock:
+                if not self.alive():
+                    raise PipelineError("Chatterbox worker process has exited.")
+                try:
+                    assert self._proc.stdin is not None and self._proc.stdout is not None
+                    for request in chunk:
+                        self._proc.stdin.write(json.dumps(request) + "\n")
+                    self._proc.stdin.flush()
+                    lines = [self._proc.stdout.readline() for _ in chunk]
+                except (BrokenPipeError, OSError) as exc:
+                    raise PipelineError(f"Chatterbox worker pipe failed: {exc}") from exc
+            for line in lines:
+                if not line:
+                    raise PipelineError("Chatterbox worker closed its stdout (crashed?).")
+                try:
+                    responses.append(json.loads(line))
+                except json.JSONDecodeError as exc:
+                    raise PipelineError(f"Chatterbox worker sent invalid JSON: {line!r}") from exc
+        return responses
+
+    def synthesize_batch(self, requests: List[dict]) -> List[dict]:
+        """Send one batch request and return the per-item responses in order.
+
+        Unlike :meth:`synthesize_many`, the whole list travels as a single
+        {"batch": [...]} line answered with one {"results": [...]} line, so
+        the worker sees the full batch at once and can run it through a
+        batched forward pass when the model supports one. Per-item failures
+        come back in their response dicts; only transport errors raise.
+        """
+
+        request = json.dumps({"batch": requests})
+        with self._lock:
+            if not self.alive():
+                raise PipelineError("Chatterbox worker process has exited.")
+            try:
+                assert self._proc.stdin is not None and self._proc.stdout is not None
+                self._proc.stdin.write(request + "\n")
+                self._proc.stdin.flush()
+                line = self._proc.stdout.readline()
+            except (BrokenPipeError, OSError) as exc:
+                raise PipelineError(f"Chatterbox worker pipe failed: {exc}") from exc
+        if not line:
+            raise PipelineError("Chatterbox worker closed its stdout (crashed?).")
+        try:
+            response = json.loads(line)
+        except json.JSONDecodeError as exc:
+            raise PipelineError(f"Chatterbox worker sent invalid JSON: {line!r}") from exc
+        if response.get("error"):
+            raise PipelineError(f"Chatterbox worker error: {response['error']}")
+        results = response.get("results")
+        if not isinstance(results, list) or len(results) != len(requests):
+            raise PipelineError("Chatterbox worker batch response does not match the request count.")
+        return results
+
+    def __enter__(self) -> "ChatterboxWorker":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._proc.poll() is not None:
+            return
+        try:
+            if self._proc.stdin:
+                self._proc.stdin.close()  # EOF makes the serve loop exit cleanly
+            self._proc.wait(timeout=10)
+        except Exception:
+            # SIGTERM first so torch/CUDA teardown can run; SIGKILL only if
+            # the worker ignores it.
+            self._proc.terminate()
+            try:
+                self._proc.wait(timeout=5)
+            except Exception:
+                self._proc.kill()
+                self._proc.wait()
 
 
 def segment_audio_duration(path: Path) -> float:
-    """Return the duration of an audio file using ffprobe."""
+    """Return the duration of an audio file.
+
+    Everything this pipeline writes is RIFF WAV, so the common case is a
+    header read (frames / sample rate) via the stdlib ``wave`` module with
+    soundfile covering non-canonical WAV encodings. ffprobe remains only as
+    the last resort for foreign input, since it costs a fork+exec per call.
+    """
+
+    try:
+        with wave.open(str(path), "rb") as handle:
+            rate = handle.getframerate()
+            if rate > 0:
+                return handle.getnframes() / rate
+    except (wave.Error, EOFError, OSError):
+        pass
+    try:
+        _, sf = _audio_libs()
+        return float(sf.info(str(path)).duration)
+    except (PipelineError, RuntimeError):
+        pass
 
     result = subprocess.run(
         [
@@ -563,58 +1640,277 @@ def segment_audio_duration(path: Path) -> float:
         raise PipelineError(f"Unable to parse duration from ffprobe output: {result.stdout}") from exc
 
 
-def stretch_segment(input_path: Path, output_path: Path, target_duration: float) -> None:
-    """Time-stretch an audio clip so that its duration matches the target duration using pydub."""
+def build_atempo_filter(speed: float) -> str:
+    """Build an ffmpeg atempo chain for an arbitrary speed ratio.
+
+    A single atempo stage only accepts factors in [0.5, 2.0], so larger
+    ratios are decomposed into a chain of in-range stages. The ratio is
+    rounded to three decimals so segments with near-identical speeds share
+    one memoised chain.
+    """
+
+    return _build_atempo_filter_cached(round(speed, 3))
+
+
+@functools.lru_cache(maxsize=512)
+def _build_atempo_filter_cached(speed: float) -> str:
+    if speed <= 0.0:
+        raise PipelineError(f"Cannot build atempo chain for non-positive speed {speed}")
+    if 0.5 <= speed <= 2.0:
+        return f"atempo={speed:.6f}"
+    # Closed form: floor(|log2(speed)|) full 2.0 (or 0.5) stages plus one residual.
+    base = 2.0 if speed > 1.0 else 0.5
+    stages = int(math.floor(abs(math.log2(speed))))
+    residual = speed / (base ** stages)
+    if not 0.5 <= residual <= 2.0:  # float error at a power-of-two boundary
+        stages += 1
+        residual = speed / (base ** stages)
+    return ",".join([f"atempo={base:.6f}"] * stages + [f"atempo={residual:.6f}"])
+
+
+def stretch_segments_batch(jobs: Iterable[Tuple[Path, Path, float, Optional[float]]]) -> None:
+    """Time-stretch many clips with a single ffmpeg invocation.
+
+    Each job is (input_path, output_path, target_duration, current_duration);
+    pass the clip's duration when the producer already knows it (the TTS
+    worker reports it) so no per-clip probing happens at all. Unknown
+    durations come from a soundfile header parse, with ffprobe as the last
+    resort for non-RIFF input. All inputs are fed to one process as multiple
+    ``-i`` arguments with a shared filter_complex graph, so file parsing and
+    codec init are paid once instead of per clip. Near-unity ratios are plain
+    file copies and stay out of the graph.
+    """
 
-    current_duration = segment_audio_duration(input_path)
-    if current_duration <= 0:
-        raise PipelineError(f"Segment {input_path} has zero/negative duration; cannot stretch.")
+    _, sf = _audio_libs()
+    job_list = list(jobs)
 
-    target_duration = max(0.1, target_duration)  # Min 100ms
-    speed = current_duration / target_duration
-    if speed == 1.0:
-        # No-op: copy
-        run_command(["cp", str(input_path), str(output_path)])
+    def _resolve_duration(job: Tuple[Path, Path, float, Optional[float]]) -> float:
+        input_path, _, _, current = job
+        if current is not None and current > 0:
+            return current
+        try:
+            return float(sf.info(str(input_path)).duration)
+        except RuntimeError:
+            return segment_audio_duration(input_path)
+
+    unknown = sum(1 for job in job_list if job[3] is None or job[3] <= 0)
+    if unknown > 1:
+        # Unknown durations may hit the ffprobe fallback; those blocking
+        # subprocesses are independent, so probe them concurrently.
+        with ThreadPoolExecutor(max_workers=min(unknown, os.cpu_count() or 1)) as executor:
+            durations = list(executor.map(_resolve_duration, job_list))
+    else:
+        durations = [_resolve_duration(job) for job in job_list]
+
+    pending: List[Tuple[Path, Path, float]] = []
+    for (input_path, output_path, target_duration, _), current_duration in zip(job_list, durations):
+        if current_duration <= 0:
+            raise PipelineError(f"Segment {input_path} has zero/negative duration; cannot stretch.")
+        if target_duration <= 1e-3:
+            # Placeholder target from `segment.duration or 1e-3`: squeezing a
+            # real clip into it is meaningless, so ship the clip as-is.
+            _link_or_copy(str(input_path), str(output_path))
+            continue
+        target = max(0.1, target_duration)  # Min 100ms
+        speed = current_duration / target
+        # Within +/-3% of unity an atempo re-encode is pure overhead (and adds
+        # resampling artifacts); the raw clip already fits the slot.
+        if 0.97 <= speed <= 1.03:
+            _link_or_copy(str(input_path), str(output_path))
+        else:
+            pending.append((input_path, output_path, speed))
+    if not pending:
         return
 
-    clip = AudioSegment.from_file(input_path)
-    # Use speedup (preserves pitch better than atempo)
-    stretched = speedup(clip, playback_speed=speed, chunk_size=150, crossfade=25)  # Tuned for naturalness
-    stretched.export(output_path, format="wav")
+    command: List[str] = []
+    for input_path, _, _ in pending:
+        command.extend(["-i", str(input_path)])
+    filter_parts = [
+        f"[{index}:a]{build_atempo_filter(speed)}[a{index}]"
+        for index, (_, _, speed) in enumerate(pending)
+    ]
+    command.extend(["-filter_complex", ";".join(filter_parts)])
+    for index, (_, output_path, _) in enumerate(pending):
+        command.extend(["-map", f"[a{index}]", str(output_path)])
+    _ffmpeg(command)
+
+
+def stretch_segment(
+    input_path: Path,
+    output_path: Path,
+    target_duration: float,
+    current_duration: Optional[float] = None,
+) -> None:
+    """Time-stretch a single audio clip so its duration matches the target."""
+
+    stretch_segments_batch([(input_path, output_path, target_duration, current_duration)])
+
+
+_ASSEMBLE_BLOCK_FRAMES = 1 << 16
 
 
 def assemble_segments(segments: Iterable[GeneratedSegment], output_path: Path) -> None:
-    """Overlay the generated dialogue segments into a single audio track with gap filling."""
+    """Mix the generated dialogue segments into a single audio track.
+
+    The output WAV is pre-sized with zeros once and then used as the mix
+    buffer directly: each clip is read, faded at its edges, and slice-added
+    into the file at its start offset through a SoundFile opened in ``r+``
+    mode. The working set is bounded by the largest single clip rather than
+    the whole track, so long videos never hold the full mix in RAM. A final
+    chunked pass peak-normalises in place before the PCM_16 result is done.
+    """
+
+    np, sf = _audio_libs()
+    ordered = sorted(segments, key=lambda seg: seg.transcript.start)
+    if not ordered:
+        raise PipelineError("No generated segments provided for assembly.")
+
+    sample_rate = sf.info(str(ordered[0].audio_path)).samplerate
+    total_frames = int(math.ceil(ordered[-1].transcript.end * sample_rate)) + sample_rate  # +1s tail
+
+    # Pre-size the output with zero frames written in bounded chunks.
+    zeros = np.zeros(_ASSEMBLE_BLOCK_FRAMES, dtype=np.float32)
+    with sf.SoundFile(str(output_path), mode="w", samplerate=sample_rate, channels=1, subtype="PCM_16") as out:
+        remaining = total_frames
+        while remaining > 0:
+            count = min(remaining, _ASSEMBLE_BLOCK_FRAMES)
+            out.write(zeros[:count])
+            remaining -= count
+
+    fade_frames = int(0.05 * sample_rate)  # 50ms edge fades against clicks
+    with sf.SoundFile(str(output_path), mode="r+") as out:
+        for seg in ordered:
+            clip, sr = sf.read(str(seg.audio_path), dtype="float32")
+            if clip.ndim > 1:
+                clip = clip.mean(axis=1)
+            if sr != sample_rate:
+                # Fallback beeps are written at 22.05 kHz while Chatterbox
+                # emits 24 kHz; resample in-place so --allow-fallback runs
+                # still assemble. Linear interpolation is plenty for speech
+                # clips this short (and exact for the sine fallback).
+                src_frames = len(clip)
+                dst_frames = int(round(src_frames * sample_rate / sr))
+                if src_frames and dst_frames:
+                    clip = np.interp(
+                        np.linspace(0.0, src_frames - 1, dst_frames),
+                        np.arange(src_frames),
+                        clip,
+                    ).astype(np.float32)
+                else:
+                    clip = np.zeros(0, dtype=np.float32)
+            frames = len(clip)
+            if frames == 0:
+                continue
+            fade = min(fade_frames, frames // 2)
+            if fade > 0:
+                ramp = np.linspace(0.0, 1.0, fade, dtype=np.float32)
+                clip[:fade] *= ramp
+                clip[frames - fade :] *= ramp[::-1]
+            start = int(seg.transcript.start * sample_rate)
+            end = min(start + frames, total_frames)
+            if end <= start:
+                continue
+            # Read-modify-write so overlapping clips mix instead of clobbering.
+            out.seek(start)
+            existing = out.read(end - start, dtype="float32")
+            out.seek(start)
+            out.write(existing + clip[: end - start])
+
+        # Streamed peak-normalise: one chunked scan, one chunked rewrite.
+        peak = 0.0
+        out.seek(0)
+        for block in out.blocks(blocksize=_ASSEMBLE_BLOCK_FRAMES, dtype="float32"):
+            if block.size:
+                peak = max(peak, float(np.max(np.abs(block))))
+        if peak > 0.0:
+            gain = (10.0 ** (-0.1 / 20.0)) / peak  # 0.1 dB headroom
+            position = 0
+            while position < total_frames:
+                out.seek(position)
+                block = out.read(min(_ASSEMBLE_BLOCK_FRAMES, total_frames - position), dtype="float32")
+                if not len(block):
+                    break
+                out.seek(position)
+                out.write(block * gain)
+                position += len(block)
+
+
+def assemble_segments_ffmpeg(segments: Iterable[GeneratedSegment], output_path: Path) -> None:
+    """Mix the dialogue segments with a single ffmpeg adelay+amix graph.
+
+    Alternative to the NumPy assembly: each clip is delayed to its start
+    offset and summed by amix entirely inside libavfilter, so the whole
+    mixdown is one process with no Python-side PCM traffic. amix with
+    ``normalize=0`` sums at unity gain; a limiter guards overlaps against
+    clipping.
+    """
 
     ordered = sorted(segments, key=lambda seg: seg.transcript.start)
     if not ordered:
         raise PipelineError("No generated segments provided for assembly.")
 
-    # Compute total duration with padding
-    total_duration_ms = int(math.ceil(ordered[-1].transcript.end * 1000)) + 1000  # +1s tail
-    final_audio = AudioSegment.silent(duration=total_duration_ms)
+    args: List[str] = []
+    for seg in ordered:
+        args.extend(["-i", str(seg.audio_path)])
+    filter_parts = [
+        f"[{index}:a]adelay={max(0, int(seg.transcript.start * 1000))}:all=1[a{index}]"
+        for index, seg in enumerate(ordered)
+    ]
+    labels = "".join(f"[a{index}]" for index in range(len(ordered)))
+    filter_parts.append(f"{labels}amix=inputs={len(ordered)}:normalize=0,alimiter=limit=0.98[mix]")
+    args.extend(["-filter_complex", ";".join(filter_parts), "-map", "[mix]", str(output_path)])
+    _ffmpeg(args)
+
+
+def assemble_segments_concat(segments: Iterable[GeneratedSegment], output_path: Path) -> None:
+    """Join non-overlapping dialogue segments with the concat demuxer.
+
+    Gaps between clips become silence WAVs written in-process, then one
+    ffmpeg run stream-copies every clip into the final track (``-f concat
+    -c copy``): no decode, no mixing, no per-clip process. Only valid when
+    segments never overlap and all clips share a format, so anything else
+    is handed to the mix-based assembler.
+    """
+
+    np, sf = _audio_libs()
+    ordered = sorted(segments, key=lambda seg: seg.transcript.start)
+    if not ordered:
+        raise PipelineError("No generated segments provided for assembly.")
 
-    prev_end_ms = 0
+    info = sf.info(str(ordered[0].audio_path))
+    sample_rate, channels = info.samplerate, info.channels
+    cursor = 0.0
     for seg in ordered:
-        # Insert silence for gaps > 100ms
-        gap_start = prev_end_ms
-        gap_end = int(seg.transcript.start * 1000)
-        if gap_end - gap_start > 100:
-            silence = AudioSegment.silent(duration=gap_end - gap_start)
-            final_audio = final_audio.overlay(silence, position=gap_start)  # Explicit, though silent base
-
-        clip = AudioSegment.from_file(seg.audio_path, format="wav")
-        clip = clip.fade_in(50).fade_out(50)
-        position_ms = int(seg.transcript.start * 1000)
-        final_audio = final_audio.overlay(clip, position=position_ms)
-        prev_end_ms = max(prev_end_ms, position_ms + len(clip))
-
-    # Normalize with compression to avoid clipping
-    final_audio = normalize(final_audio)
-    # Added: Light compression
-    from pydub.effects import compress_dynamic_range  # Assumes pydub 0.25+
-    final_audio = compress_dynamic_range(final_audio, threshold=-20.0, ratio=4.0, attack=5.0, release=50.0)
-    final_audio.export(output_path, format="wav", bitrate="192k")
+        if seg.transcript.start < cursor - 1e-3:
+            logger.warning("Segments overlap; falling back to mix-based assembly for correctness")
+            assemble_segments(ordered, output_path)
+            return
+        clip_info = sf.info(str(seg.audio_path))
+        if clip_info.samplerate != sample_rate or clip_info.channels != channels:
+            logger.warning("Segment formats differ; falling back to mix-based assembly")
+            assemble_segments(ordered, output_path)
+            return
+        cursor = seg.transcript.end
+
+    workdir = output_path.parent
+    entries: List[Path] = []
+    cursor = 0.0
+    for index, seg in enumerate(ordered):
+        gap = seg.transcript.start - cursor
+        if gap > 1e-3:
+            silence = workdir / f"concat_gap_{index:04d}.wav"
+            frames = int(round(gap * sample_rate))
+            sf.write(str(silence), np.zeros((frames, channels), dtype=np.int16), sample_rate, subtype="PCM_16")
+            entries.append(silence)
+        entries.append(seg.audio_path)
+        cursor = max(cursor, seg.transcript.end)
+
+    list_file = workdir / "concat_list.txt"
+    list_file.write_text(
+        "".join("file '{}'\n".format(str(entry).replace("'", r"'\''")) for entry in entries),
+        encoding="utf-8",
+    )
+    _ffmpeg(["-f", "concat", "-safe", "0", "-i", str(list_file), "-c", "copy", str(output_path)])
 
 
 def replace_audio_track(
@@ -622,18 +1918,35 @@ def replace_audio_track(
     new_audio: Path,
     output_video: Path,
 ) -> None:
-    """Mux a video file with a replacement audio track."""
+    """Mux a video file with a replacement audio track.
 
-    run_command(
+    Video is always stream-copied. Audio is stream-copied too when the new
+    track's codec already suits the output container (WAV into .mkv/.avi,
+    AAC into .mp4/.mov), dodging a full-length re-encode during the mux;
+    otherwise it is encoded once to AAC with faststart for MP4-family
+    output.
+    """
+
+    suffix = output_video.suffix.lower()
+    audio_suffix = new_audio.suffix.lower()
+    if (suffix in (".mkv", ".avi") and audio_suffix == ".wav") or (
+        suffix in (".mp4", ".mov", ".m4v") and audio_suffix in (".m4a", ".aac")
+    ):
+        audio_args = ["-c:a", "copy"]
+    else:
+        audio_args = ["-c:a", "aac", "-b:a", "192k"]
+        if suffix in (".mp4", ".mov", ".m4v"):
+            audio_args += ["-movflags", "+faststart"]
+
+    _ffmpeg(
         [
-            "ffmpeg",
-            "-y",
             "-i",
             str(input_video),
             "-i",
             str(new_audio),
             "-c:v",
             "copy",
+            *audio_args,
             "-map",
             "0:v:0",
             "-map",
@@ -656,13 +1969,53 @@ def generate_segments(
     cfg_weight: Optional[float] = None,
     allow_fallback: bool = False,  # Added: Propagate
     verbose: bool = False,  # Added: Propagate
+    tts_workers: Optional[int] = None,
+    tts_batch_size: Optional[int] = None,
 ) -> List[GeneratedSegment]:
-    """Generate and time-stretch Chatterbox audio clips for each transcript segment."""
+    """Generate and time-stretch Chatterbox audio clips for each transcript segment.
+
+    Segments are independent, so when `tts_workers` > 1 they are dispatched
+    concurrently (the heavy work happens in subprocesses, so threads suffice).
+    The first segment is always synthesized alone so model download/load warms
+    up once instead of N cold starts hammering the disk simultaneously.
+    """
 
     def split_long_segment(segment: TranscriptSegment, max_duration: float = 15.0) -> List[TranscriptSegment]:
         if segment.duration <= max_duration:
             return [segment]
 
+        if segment.words:
+            # Cut at real word boundaries: sweep the word list once and emit
+            # a sub-segment whenever the accumulated span would pass the cap.
+            # Real timestamps beat the linear interpolation below - cuts land
+            # in natural gaps, so stretched clips need less correction.
+            sub_segments: List[TranscriptSegment] = []
+            chunk: List[Tuple[float, float, str]] = []
+            chunk_start = segment.words[0][0]
+            for word in segment.words:
+                if chunk and word[1] - chunk_start > max_duration:
+                    sub_segments.append(
+                        TranscriptSegment(
+                            start=chunk_start,
+                            end=chunk[-1][1],
+                            text=" ".join(w[2] for w in chunk),
+                            words=list(chunk),
+                        )
+                    )
+                    chunk = []
+                    chunk_start = word[0]
+                chunk.append(word)
+            if chunk:
+                sub_segments.append(
+                    TranscriptSegment(
+                        start=chunk_start,
+                        end=chunk[-1][1],
+                        text=" ".join(w[2] for w in chunk),
+                        words=list(chunk),
+                    )
+                )
+            return sub_segments
+
         words = segment.text.split()
         if not words:
             return [segment]
@@ -687,52 +2040,261 @@ def generate_segments(
             idx += chunk_word_count
         return sub_segments
 
-    all_segments: List[TranscriptSegment] = []
-    for seg in segments:
-        all_segments.extend(split_long_segment(seg))
+    # Consumed lazily: when `segments` is a live transcription stream, TTS on
+    # early segments overlaps Whisper decoding of later ones.
+    segment_stream = (sub for seg in segments for sub in split_long_segment(seg))
+
+    # Repeated utterances across segments (and re-runs) hit the on-disk cache
+    # keyed by text + voice prompt + synthesis params instead of the model.
+    prompt_digest = _hash_file(audio_prompt)
+    params_sig = "|".join(
+        str(value)
+        for value in (
+            device,
+            multilingual,
+            language,
+            exaggeration,
+            cfg_weight,
+            os.environ.get("CHATTERBOX_STEPS", ""),
+            os.environ.get("CHATTERBOX_ATTN_IMPL", ""),
+            os.environ.get("CHATTERBOX_MAX_NEW_TOKENS", ""),
+        )
+    )
 
-    generated: List[GeneratedSegment] = []
-    for index, segment in enumerate(all_segments):
-        print(f"[pipeline] Synthesizing segment {index + 1}/{len(all_segments)}: '{segment.text[:40]}' duration={segment.duration:.2f}s")
-        raw_clip = workdir / f"segment_{index:04d}_raw.wav"
-        stretched_clip = workdir / f"segment_{index:04d}_aligned.wav"
+    # One resident worker amortises the model load over all segments; the
+    # one-shot CLI remains as a fallback if the worker cannot start or dies.
+    worker: Optional[ChatterboxWorker] = None
+    if os.environ.get("CHATTERBOX_SERVE", "1") != "0":
+        try:
+            worker = ChatterboxWorker(
+                speaker_wav=audio_prompt,
+                device=device,
+                multilingual=multilingual,
+                language=language,
+                exaggeration=exaggeration,
+                cfg_weight=cfg_weight,
+                verbose=verbose,
+            )
+        except OSError as exc:
+            logger.warning("Could not start Chatterbox worker; using one-shot CLI: %s", exc)
 
-        # Adaptive timeout: longer for longer text/first call
-        text_len = max(1, len(segment.text.strip()))
-        base_timeout = int(os.environ.get("CHATTERBOX_TIMEOUT", "120"))
-        per_call_timeout = max(base_timeout, int(1.5 * text_len)) if index == 0 else base_timeout
+    warmed = False
+    prompt_tensor: Optional[Path] = None
+
+    def _warmup_cli() -> bool:
+        """Absorb TTS cold-start cost with one throwaway synthesis.
 
+        The first one-shot CLI call pays weight download and page-cache fill
+        on top of inference; running a 1-word synthesis up front under a
+        generous timeout lets every real segment use the tight per-call one.
+        """
+
+        warmup_clip = workdir / "warmup.wav"
         try:
             chatterbox_tts(
-                text=segment.text,
+                text=".",
                 audio_prompt=audio_prompt,
-                output_path=raw_clip,
+                output_path=warmup_clip,
                 device=device,
                 multilingual=multilingual,
                 language=language,
                 exaggeration=exaggeration,
                 cfg_weight=cfg_weight,
-                allow_fallback=allow_fallback,
-                timeout_override=per_call_timeout,
+                allow_fallback=True,
+                timeout_override=int(os.environ.get("CHATTERBOX_WARMUP_TIMEOUT", "480")),
                 verbose=verbose,
+                speaker_tensor=prompt_tensor,
             )
+            return True
+        except PipelineError as exc:
+            logger.warning("TTS warmup failed (continuing without it): %s", exc)
+            return False
+        finally:
+            warmup_clip.unlink(missing_ok=True)
+
+    def _synthesize_one(index: int, segment: TranscriptSegment) -> Tuple[TranscriptSegment, Path, Path, Optional[float]]:
+        print(f"[pipeline] Synthesizing segment {index + 1}/{total}: '{segment.text[:40]}' duration={segment.duration:.2f}s")
+        raw_clip = workdir / f"segment_{index:04d}_raw.wav"
+        stretched_clip = workdir / f"segment_{index:04d}_aligned.wav"
+
+        # Adaptive timeout: longer for longer text, and for the first call
+        # unless a warmup run has already absorbed the cold start.
+        text_len = max(1, len(segment.text.strip()))
+        base_timeout = int(os.environ.get("CHATTERBOX_TIMEOUT", "120"))
+        per_call_timeout = max(base_timeout, int(1.5 * text_len)) if index == 0 and not warmed else base_timeout
+
+        cached_wav = tts_cache_path(segment.text, prompt_digest=prompt_digest, params_sig=params_sig)
+        if cached_wav.exists():
+            _link_or_copy(str(cached_wav), str(raw_clip))
+            return (segment, raw_clip, stretched_clip, None)
+
+        raw_duration: Optional[float] = None
+        cacheable = True
+        try:
+            if worker is not None and worker.alive():
+                response = worker.synthesize(text=segment.text, output_path=raw_clip)
+                if response.get("note") == "fallback_beep_audio":
+                    if not allow_fallback:
+                        raise PipelineError("Chatterbox worker fell back to beep audio.")
+                    cacheable = False
+                duration = response.get("duration_sec")
+                raw_duration = float(duration) if duration is not None else None
+            else:
+                raw_duration = chatterbox_tts(
+                    text=segment.text,
+                    audio_prompt=audio_prompt,
+                    output_path=raw_clip,
+                    device=device,
+                    multilingual=multilingual,
+                    language=language,
+                    exaggeration=exaggeration,
+                    cfg_weight=cfg_weight,
+                    allow_fallback=allow_fallback,
+                    timeout_override=per_call_timeout,
+                    verbose=verbose,
+                    speaker_tensor=prompt_tensor,
+                )
+                # The one-shot CLI does not report fallback notes back here,
+                # so with --allow-fallback its output cannot be trusted to be
+                # real speech.
+                cacheable = not allow_fallback
         except PipelineError as exc:
             if allow_fallback:
-                logging.warning(f"Using beep fallback for segment {index}: {exc}")
+                logger.warning("Using beep fallback for segment %s: %s", index, exc)
                 try:
                     synthesize_beep(raw_clip, duration=segment.duration or 0.5)
+                    raw_duration = max(0.2, segment.duration or 0.5)
+                    cacheable = False
                 except Exception as beep_exc:
                     raise PipelineError(f"Beep fallback failed: {beep_exc}; original: {exc}") from exc
             else:
                 raise
 
-        stretch_segment(raw_clip, stretched_clip, target_duration=segment.duration or 1e-3)
-        generated.append(GeneratedSegment(transcript=segment, audio_path=stretched_clip))
+        if cacheable:
+            tts_cache_store(raw_clip, cached_wav)
+
+        return (segment, raw_clip, stretched_clip, raw_duration)
+
+    def _synthesize_all_streamed() -> List[Tuple[TranscriptSegment, Path, Path, Optional[float]]]:
+        """Stream segments from the transcript source through the worker.
+
+        Segments are pulled from `segment_stream` as they arrive and flushed
+        to the worker in pipelined batches, so synthesis overlaps a live
+        transcription instead of waiting for the full list.
+        """
+
+        assert worker is not None
+        results: List[Tuple[TranscriptSegment, Path, Path, Optional[float]]] = []
+        batch: List[Tuple[int, TranscriptSegment, Path, Path, Path]] = []
+        # Accumulate at least one full batch before flushing so a batch size
+        # above the pipeline chunk still reaches the worker intact.
+        flush_threshold = max(ChatterboxWorker._PIPELINE_CHUNK, tts_batch_size or 0)
+
+        def _flush() -> None:
+            if not batch:
+                return
+            if tts_batch_size and tts_batch_size > 1:
+                # Sorted bucketing: batches of like-length texts minimise the
+                # padding a batched forward pass spends on short items. Safe
+                # to reorder here — each clip lands in its own indexed file
+                # and assembly re-sorts by transcript start time.
+                batch.sort(key=lambda item: len(item[1].text))
+            payloads = [{"text": segment.text, "out": str(raw_clip)} for _, segment, raw_clip, _, _ in batch]
+            if tts_batch_size and tts_batch_size > 1:
+                # One batch request per slice lets the worker run a batched
+                # forward pass instead of decoding utterances one by one.
+                responses: List[dict] = []
+                for start in range(0, len(payloads), tts_batch_size):
+                    responses.extend(worker.synthesize_batch(payloads[start : start + tts_batch_size]))
+            else:
+                responses = worker.synthesize_many(payloads)
+            for (i, segment, raw_clip, stretched_clip, cached_wav), response in zip(batch, responses):
+                raw_duration: Optional[float] = None
+                cacheable = True
+                error = response.get("error")
+                used_beep = response.get("note") == "fallback_beep_audio"
+                if error or (used_beep and not allow_fallback):
+                    if not allow_fallback:
+                        raise PipelineError(
+                            f"Chatterbox worker failed on segment {i}: {error or 'fell back to beep audio'}"
+                        )
+                    logger.warning("Using beep fallback for segment %s: %s", i, error or "worker beep")
+                    synthesize_beep(raw_clip, duration=segment.duration or 0.5)
+                    raw_duration = max(0.2, segment.duration or 0.5)
+                    cacheable = False
+                else:
+                    cacheable = not used_beep
+                    duration = response.get("duration_sec")
+                    raw_duration = float(duration) if duration is not None else None
+                if cacheable:
+                    tts_cache_store(raw_clip, cached_wav)
+                results.append((segment, raw_clip, stretched_clip, raw_duration))
+            batch.clear()
+
+        for i, segment in enumerate(segment_stream):
+            print(f"[pipeline] Queueing segment {i + 1}: '{segment.text[:40]}' duration={segment.duration:.2f}s")
+            raw_clip = workdir / f"segment_{i:04d}_raw.wav"
+            stretched_clip = workdir / f"segment_{i:04d}_aligned.wav"
+            cached_wav = tts_cache_path(segment.text, prompt_digest=prompt_digest, params_sig=params_sig)
+            if cached_wav.exists():
+                _link_or_copy(str(cached_wav), str(raw_clip))
+                results.append((segment, raw_clip, stretched_clip, None))
+                continue
+            batch.append((i, segment, raw_clip, stretched_clip, cached_wav))
+            if len(batch) >= flush_threshold:
+                _flush()
+        _flush()
+        return results
+
+    try:
+        if worker is not None and worker.alive():
+            synthesized = _synthesize_all_streamed()
+        else:
+            all_segments = list(segment_stream)
+            total = len(all_segments)
+            if total:
+                # Decode the prompt once so every CLI call loads a tensor
+                # instead of re-running the decode+resample.
+                prompt_tensor = _prepare_prompt_tensor(audio_prompt, workdir)
+            if total and os.environ.get("CHATTERBOX_WARMUP", "1") != "0":
+                warmed = _warmup_cli()
+            workers = max(1, min(total, tts_workers or (os.cpu_count() or 1)))
+            if workers <= 1 or total <= 1:
+                synthesized = [_synthesize_one(i, seg) for i, seg in enumerate(all_segments)]
+            else:
+                results: List[Optional[Tuple[TranscriptSegment, Path, Path, Optional[float]]]] = [None] * total
+                results[0] = _synthesize_one(0, all_segments[0])
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        executor.submit(_synthesize_one, i, seg): i
+                        for i, seg in enumerate(all_segments[1:], start=1)
+                    }
+                    for future in as_completed(futures):
+                        results[futures[future]] = future.result()
+                synthesized = [item for item in results if item is not None]
+    finally:
+        if worker is not None:
+            worker.close()
+
+    # One ffmpeg process stretches every clip instead of one spawn per segment.
+    stretch_segments_batch(
+        (raw_clip, stretched_clip, segment.duration or 1e-3, raw_duration)
+        for segment, raw_clip, stretched_clip, raw_duration in synthesized
+    )
+    return [
+        GeneratedSegment(transcript=segment, audio_path=stretched_clip)
+        for segment, _, stretched_clip, _ in synthesized
+    ]
+
 
-    return generated
+@functools.lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """Construct the CLI parser once; repeat callers only re-parse argv.
 
+    Environment-variable defaults are therefore read on the first build,
+    which matches a normal CLI run where the environment is fixed.
+    """
 
-def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Replace a video's dialogue with a Chatterbox cloned voice.")
     parser.add_argument("--input-video", type=Path, required=True, help="Source video file")
     parser.add_argument("--output-video", type=Path, required=True, help="Destination video file")
@@ -767,8 +2329,17 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--ct2-compute",
-        default=os.environ.get("WHISPER_CT2_COMPUTE", "int8"),
-        help="CTranslate2 compute type for faster-whisper (e.g. int8, int8_float16, float16, float32).",
+        default=os.environ.get("WHISPER_CT2_COMPUTE") or None,
+        help=(
+            "CTranslate2 compute type for faster-whisper (int8, int8_float16, bfloat16, float16, "
+            "float32). Default picks int8 on CPU and int8_float16 on CUDA."
+        ),
+    )
+    parser.add_argument(
+        "--ct2-batch-size",
+        type=int,
+        default=int(os.environ.get("WHISPER_BATCH", "8")),
+        help="faster-whisper BatchedInferencePipeline batch size (<=1 uses the sequential decoder).",
     )
     parser.add_argument(
         "--ct2-beam-size",
@@ -794,6 +2365,11 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         default=None,
         help="Thread count for whisper.cpp (overrides WHISPER_CPP_THREADS)",
     )
+    parser.add_argument(
+        "--whisper-cpp-quant",
+        default=os.environ.get("WHISPER_CPP_QUANT"),
+        help="Quantization suffix selecting a sibling ggml model, e.g. q5_0 or q8_0",
+    )
     parser.add_argument(
         "--word-timestamps",
         dest="word_timestamps",
@@ -823,6 +2399,65 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
     parser.add_argument("--language", default=os.environ.get("WHISPER_LANGUAGE", "en"), help="Language id for multilingual model (e.g. en, fr, zh)")
     parser.add_argument("--exaggeration", type=float, default=None, help="Emotion/exaggeration control (0..1)")
     parser.add_argument("--cfg-weight", dest="cfg_weight", type=float, default=None, help="Guidance weight (0..1)")
+    parser.add_argument(
+        "--vad-filter",
+        dest="vad_filter",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Skip silence inside faster-whisper via its Silero VAD (--no-vad-filter disables)",
+    )
+    parser.add_argument(
+        "--coalesce",
+        dest="coalesce",
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help="Merge adjacent short transcript segments (<300ms gap, <=12s span) into one TTS call each (--no-coalesce disables)",
+    )
+    parser.add_argument(
+        "--assembly-engine",
+        choices=["numpy", "ffmpeg", "concat"],
+        default=os.environ.get("ASSEMBLY_ENGINE", "numpy"),
+        help=(
+            "Mixdown engine: 'numpy' streams into a pre-sized WAV, 'ffmpeg' uses one adelay+amix "
+            "graph, 'concat' stream-copies non-overlapping clips with silence fillers"
+        ),
+    )
+    parser.add_argument(
+        "--vad-parallel-workers",
+        type=int,
+        default=int(os.environ.get("VAD_PARALLEL_WORKERS", "0")),
+        help="Transcribe VAD-split speech chunks concurrently with this many workers (0 = off; faster-whisper only)",
+    )
+    parser.add_argument(
+        "--vad-silence-db",
+        type=float,
+        default=float(os.environ.get("VAD_SILENCE_DB", "-35.0")),
+        help="silencedetect noise threshold in dB for the VAD split (lower = stricter)",
+    )
+    parser.add_argument(
+        "--vad-min-silence",
+        type=float,
+        default=float(os.environ.get("VAD_MIN_SILENCE", "0.6")),
+        help="Minimum silence run in seconds treated as a VAD split boundary",
+    )
+    parser.add_argument(
+        "--whisper-processors",
+        type=int,
+        default=int(os.environ.get("WHISPER_PROCS", "0")),
+        help="Split transcription into this many parallel time slices (whisper.cpp -p; silence-split workers for faster-whisper; 0 = off)",
+    )
+    parser.add_argument(
+        "--tts-workers",
+        type=int,
+        default=int(os.environ.get("TTS_WORKERS", "0")),
+        help="Concurrent TTS synthesis workers (0 = auto from CPU count, 1 = serial)",
+    )
+    parser.add_argument(
+        "--tts-batch-size",
+        type=int,
+        default=int(os.environ.get("TTS_BATCH_SIZE", "0")),
+        help="Send segments to the resident TTS worker in batches of this size (0 = pipelined single requests)",
+    )
     parser.add_argument("--allow-fallback", action="store_true", help="Allow beep fallbacks (default: error on fallback)")  # Added
     parser.add_argument("--verbose", action="store_true", help="Enable verbose logging in pipeline and CLI")  # Added
     parser.add_argument(
@@ -830,36 +2465,78 @@ def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
         action="store_true",
         help="Preserve the temporary working directory instead of deleting it",
     )
-    return parser.parse_args(argv)
+    return parser
 
 
-def load_transcript_from_json(path: Path) -> List[TranscriptSegment]:
-    try:
-        data = json.loads(path.read_text(encoding="utf-8"))
-    except json.JSONDecodeError as exc:
-        raise PipelineError(f"Failed to parse transcript JSON {path}: {exc}") from exc
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    return _build_parser().parse_args(argv)
+
+
+# Above this size the transcript is parsed incrementally (when ijson is
+# available) instead of materialising every element dict at once.
+_STREAM_PARSE_BYTES = 50 * 1024 * 1024
+
+
+def _iter_transcript_items(path: Path) -> Iterable[Any]:
+    """Return raw transcript entries, streaming the parse for huge files."""
+
+    if path.stat().st_size > _STREAM_PARSE_BYTES:
+        try:
+            import ijson  # type: ignore
+        except ImportError:
+            pass
+        else:
 
+            def _stream():
+                with path.open("rb") as handle:
+                    yield from ijson.items(handle, "item")
+
+            return _stream()
+    data = _json_loads(path.read_bytes())
     if not isinstance(data, list):
         raise PipelineError(f"Transcript JSON must be a list of segments: {path}")
+    return data
+
 
+def load_transcript_from_json(path: Path) -> List[TranscriptSegment]:
     segments: List[TranscriptSegment] = []
-    for i, item in enumerate(data):
+    try:
+        items = _iter_transcript_items(path)
+    except ValueError as exc:
+        raise PipelineError(f"Failed to parse transcript JSON {path}: {exc}") from exc
+
+    # Local bindings keep the hot loop on fast LOAD_FAST lookups instead of
+    # LOAD_GLOBAL per segment; measurable on 10k+-entry transcripts.
+    _float, _str, _segment, _append = float, str, TranscriptSegment, segments.append
+    for i, item in enumerate(items):
         try:
             # Added: Validate keys/types
-            start = float(item.get("start", 0.0))
-            end = float(item.get("end", start))  # Default to start if missing
+            get = item.get
+            start = _float(get("start", 0.0))
+            end = _float(get("end", start))  # Default to start if missing
             if end < start:
                 raise ValueError("end < start")
-            text = str(item.get("text", "")).strip()
+            text = _str(get("text", "")).strip()
             if text:
-                segments.append(TranscriptSegment(start=start, end=end, text=text))
+                _append(_segment(start=start, end=end, text=text))
         except (KeyError, TypeError, ValueError) as exc:
             raise PipelineError(f"Invalid transcript entry at index {i}: {item}") from exc
 
-    # Added: Check monotonicity
-    for i in range(1, len(segments)):
-        if segments[i].start < segments[i-1].end:
-            logging.warning(f"Overlapping segments at {i}: adjust manually if needed")
+    # Added: Check monotonicity. Vectorised so tens of thousands of segments
+    # compare in C; the interpreter only touches the offending indices.
+    if len(segments) > 1:
+        try:
+            import numpy as np
+        except ImportError:
+            overlapping: Iterable[int] = (
+                i for i in range(1, len(segments)) if segments[i].start < segments[i - 1].end
+            )
+        else:
+            starts = np.fromiter((seg.start for seg in segments), dtype=np.float64, count=len(segments))
+            ends = np.fromiter((seg.end for seg in segments), dtype=np.float64, count=len(segments))
+            overlapping = (np.nonzero(starts[1:] < ends[:-1])[0] + 1).tolist()
+        for i in overlapping:
+            logger.warning("Overlapping segments at %d: adjust manually if needed", i)
 
     return segments
 
@@ -875,16 +2552,95 @@ def main(argv: Optional[List[str]] = None) -> int:
     if not args.audio_prompt.exists():
         raise PipelineError(f"Audio prompt {args.audio_prompt} does not exist.")
 
-    with tempfile.TemporaryDirectory(prefix="voice-pipeline-") as tempdir_str:
+    # Scratch clips are written once and read once or twice; putting the
+    # workdir on tmpfs turns those round-trips into memory traffic. Override
+    # with PIPELINE_TMPDIR (e.g. when /dev/shm is too small for long videos).
+    scratch_root = os.environ.get("PIPELINE_TMPDIR")
+    if scratch_root is None and os.path.isdir("/dev/shm"):
+        scratch_root = "/dev/shm"
+    # Managed manually rather than via TemporaryDirectory so --keep-workdir
+    # can rename the directory into place instead of copying it out.
+    tempdir_str = tempfile.mkdtemp(prefix="voice-pipeline-", dir=scratch_root)
+    try:
         tempdir = Path(tempdir_str)
         print(f"Working directory: {tempdir}")
 
         extracted_audio = tempdir / "source_audio.wav"
-        extract_audio(args.input_video, extracted_audio)
+        if not args.transcript_json and args.transcriber in ("faster-whisper", "faster_whisper", "auto"):
+            # Overlap the seconds-long model load with ffmpeg's extraction;
+            # the cached loader makes the later call a dictionary hit.
+            preload_fw_model_async(
+                args.whisper_model, device=args.ct2_device, compute_type=args.ct2_compute
+            )
+        # The extracted track only feeds transcription, so land it directly
+        # in Whisper's 16 kHz mono format: smaller file, no backend resample.
+        extract_audio(args.input_video, extracted_audio, sample_rate=16000, mono=True)
         print(f"Extracted audio -> {extracted_audio}")
 
+        collected: List[TranscriptSegment] = []
+        producer: Optional[threading.Thread] = None
+        stream_transcription = (
+            not args.transcript_json
+            and args.transcriber in ("faster-whisper", "faster_whisper")
+            and not args.vad_parallel_workers
+            and not args.whisper_processors
+        )
         if args.transcript_json:
             segments = load_transcript_from_json(args.transcript_json)
+        elif stream_transcription:
+            # Pipeline transcription into synthesis: a producer thread decodes
+            # segments while the TTS worker consumes them, so synthesis of the
+            # first segments starts long before the transcript is complete.
+            # Bounded so a fast decoder cannot run arbitrarily far ahead of a
+            # slow TTS stage; 64 in-flight segments is minutes of speech.
+            segment_queue: "queue.Queue[Optional[TranscriptSegment]]" = queue.Queue(maxsize=64)
+            producer_error: List[BaseException] = []
+
+            def _produce() -> None:
+                try:
+                    # One soundfile read of the 16 kHz mono extraction spares
+                    # faster-whisper its own PyAV decode of the same file.
+                    audio_data = None
+                    try:
+                        _, sf = _audio_libs()
+                        audio_data, sr = sf.read(str(extracted_audio), dtype="float32")
+                        if getattr(audio_data, "ndim", 1) > 1:
+                            audio_data = audio_data.mean(axis=1)
+                        if sr != 16000:
+                            audio_data = None
+                    except (PipelineError, RuntimeError):
+                        audio_data = None
+                    for segment in iter_faster_whisper_segments(
+                        extracted_audio,
+                        audio_data=audio_data,
+                        model_name=args.whisper_model,
+                        device=args.ct2_device,
+                        compute_type=args.ct2_compute,
+                        beam_size=args.ct2_beam_size,
+                        word_timestamps=args.word_timestamps,
+                        language=args.language,
+                        vad_filter=args.vad_filter,
+                        batch_size=args.ct2_batch_size,
+                    ):
+                        segment_queue.put(segment)
+                except BaseException as exc:  # surfaced on the consumer side
+                    producer_error.append(exc)
+                finally:
+                    segment_queue.put(None)
+
+            def _consume():
+                while True:
+                    segment = segment_queue.get()
+                    if segment is None:
+                        break
+                    collected.append(segment)
+                    yield segment
+                if producer_error:
+                    raise producer_error[0]
+
+            producer = threading.Thread(target=_produce, name="transcribe-producer", daemon=True)
+            producer.start()
+            segments = _consume()
         else:
             segments = transcribe_audio(
                 extracted_audio,
@@ -900,16 +2656,25 @@ def main(argv: Optional[List[str]] = None) -> int:
                 whisper_cpp_model=args.whisper_cpp_model,
                 whisper_cpp_threads=args.whisper_cpp_threads,
                 language=args.language,
+                workdir=tempdir,
+                vad_parallel_workers=args.vad_parallel_workers or None,
+                vad_filter=args.vad_filter,
+                ct2_batch_size=args.ct2_batch_size,
+                whisper_cpp_quant=args.whisper_cpp_quant,
+                whisper_processors=args.whisper_processors or None,
+                vad_silence_db=args.vad_silence_db,
+                vad_min_silence=args.vad_min_silence,
             )
-        print(f"Transcribed {len(segments)} segments")
+        if not stream_transcription:
+            print(f"Transcribed {len(segments)} segments")
 
-        if args.save_transcript:
-            transcript_path = args.output_video.with_suffix(args.output_video.suffix + ".transcript.json")
-            write_transcript(segments, transcript_path)
-            print(f"Transcript saved -> {transcript_path}")
+            if args.save_transcript:
+                transcript_path = args.output_video.with_suffix(args.output_video.suffix + ".transcript.json")
+                write_transcript(segments, transcript_path)
+                print(f"Transcript saved -> {transcript_path}")
 
         generated_segments = generate_segments(
-            segments=segments,
+            segments=coalesce_segments(segments) if args.coalesce else segments,
             audio_prompt=args.audio_prompt,
             workdir=tempdir,
             device=args.device,
@@ -919,11 +2684,28 @@ def main(argv: Optional[List[str]] = None) -> int:
             cfg_weight=args.cfg_weight,
             allow_fallback=args.allow_fallback,
             verbose=args.verbose,
+            tts_workers=args.tts_workers or None,
+            tts_batch_size=args.tts_batch_size or None,
         )
+        if stream_transcription:
+            if producer is not None:
+                producer.join()
+            if not collected:
+                raise PipelineError("faster-whisper produced no segments")
+            print(f"Transcribed {len(collected)} segments")
+            if args.save_transcript:
+                transcript_path = args.output_video.with_suffix(args.output_video.suffix + ".transcript.json")
+                write_transcript(collected, transcript_path)
+                print(f"Transcript saved -> {transcript_path}")
         print(f"Generated {len(generated_segments)} voice segments")
 
         final_audio = tempdir / "final_dialogue.wav"
-        assemble_segments(generated_segments, final_audio)
+        if args.assembly_engine == "ffmpeg":
+            assemble_segments_ffmpeg(generated_segments, final_audio)
+        elif args.assembly_engine == "concat":
+            assemble_segments_concat(generated_segments, final_audio)
+        else:
+            assemble_segments(generated_segments, final_audio)
         print(f"Assembled dialogue track -> {final_audio}")
 
         replace_audio_track(args.input_video, final_audio, args.output_video)
@@ -931,14 +2713,19 @@ def main(argv: Optional[List[str]] = None) -> int:
 
         if args.keep_workdir:
             preserved = Path(str(args.output_video) + ".workdir")
-            preserved.mkdir(parents=True, exist_ok=True)
-            for item in tempdir.iterdir():
-                destination = preserved / item.name
-                if item.is_file():
-                    shutil.copy2(str(item), str(destination))  # Fixed: Use shutil.copy2
-                elif item.is_dir():
-                    shutil.copytree(str(item), str(destination), dirs_exist_ok=True)
+            if preserved.exists():
+                shutil.rmtree(preserved)
+            try:
+                # Same filesystem: an inode rename, O(1) regardless of size.
+                os.replace(tempdir_str, str(preserved))
+            except OSError:
+                # Cross-device (scratch on tmpfs, output elsewhere): hard-link
+                # files over instead of copying their bytes where possible.
+                shutil.copytree(tempdir_str, str(preserved), copy_function=_link_or_copy)
             print(f"Working files preserved in {preserved}")
+    finally:
+        if os.path.isdir(tempdir_str):
+            shutil.rmtree(tempdir_str, ignore_errors=True)
 
     return 0
 
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""Long-lived faster-whisper transcription server over a Unix socket.
+
+Every pipeline invocation normally re-constructs WhisperModel, paying a
+multi-hundred-MB weight load plus CTranslate2 init. For batch workflows,
+run this server once and point voice_replace_pipeline.py at it with
+WHISPER_SERVER_SOCK=<socket path>; the model loads a single time and each
+subsequent run starts transcribing immediately.
+
+Protocol: newline-delimited JSON, one request per connection.
+
+  request:  {"path": "/abs/audio.wav", "beam_size": 5,
+             "word_timestamps": true, "language": null,
+             "vad_filter": true, "batch_size": 8}
+  response: {"segments": [{"start": 0.0, "end": 1.2, "text": "..."}, ...]}
+            or {"error": "..."}
+
+Usage:
+  python whisper_server.py --model small --socket /tmp/whisper.sock
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import socketserver
+import sys
+
+
+def _transcribe(model, request: dict) -> list:
+    kwargs = dict(
+        beam_size=int(request.get("beam_size", 5)),
+        word_timestamps=bool(request.get("word_timestamps", True)),
+        language=request.get("language"),
+        vad_filter=bool(request.get("vad_filter", True)),
+    )
+    if kwargs["vad_filter"]:
+        kwargs["vad_parameters"] = {"min_silence_duration_ms": 500}
+    audio_path = str(request["path"])
+    batch_size = int(request.get("batch_size") or 0)
+    if batch_size > 1:
+        try:
+            from faster_whisper import BatchedInferencePipeline  # type: ignore
+
+            pipeline = BatchedInferencePipeline(model=model)
+            segments, _info = pipeline.transcribe(audio_path, batch_size=batch_size, **kwargs)
+        except (ImportError, AttributeError):  # faster-whisper < 1.1
+            segments, _info = model.transcribe(audio_path, **kwargs)
+    else:
+        segments, _info = model.transcribe(audio_path, **kwargs)
+    return [
+        {"start": float(seg.start), "end": float(seg.end), "text": str(seg.text).strip()}
+        for seg in segments
+        if getattr(seg, "text", None)
+    ]
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self) -> None:
+        line = self.rfile.readline()
+        if not line:
+            return
+        try:
+            request = json.loads(line)
+            payload = {"segments": _transcribe(self.server.model, request)}
+        except Exception as exc:  # report, don't kill the server
+            payload = {"error": str(exc)}
+        self.wfile.write(json.dumps(payload).encode("utf-8") + b"\n")
+
+
+class _Server(socketserver.ThreadingUnixStreamServer):
+    # CTranslate2 models are thread-safe for transcribe(); threading lets a
+    # batch driver overlap requests from several pipeline runs.
+    daemon_threads = True
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Keep a faster-whisper model resident behind a Unix socket")
+    parser.add_argument("--model", default=os.environ.get("WHISPER_MODEL", "small"), help="Whisper model name or CT2 dir")
+    parser.add_argument("--device", default=os.environ.get("WHISPER_CT2_DEVICE", "cpu"), help="cpu or cuda")
+    parser.add_argument(
+        "--compute-type",
+        default=os.environ.get("WHISPER_CT2_COMPUTE", "int8"),
+        help="CTranslate2 compute type (int8, int8_float16, float16, ...)",
+    )
+    parser.add_argument(
+        "--socket",
+        default=os.environ.get("WHISPER_SERVER_SOCK", "/tmp/whisper_server.sock"),
+        help="Unix socket path to listen on",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    try:
+        from faster_whisper import WhisperModel  # type: ignore
+    except ImportError:
+        print("faster-whisper is not installed. Install with `pip install faster-whisper`.", file=sys.stderr)
+        return 1
+
+    print(f"[whisper-server] Loading model={args.model} device={args.device} compute={args.compute_type}")
+    model = WhisperModel(
+        args.model,
+        device=args.device,
+        compute_type=args.compute_type,
+        cpu_threads=os.cpu_count() or 4,
+        num_workers=2,
+    )
+
+    if os.path.exists(args.socket):
+        os.unlink(args.socket)
+    server = _Server(args.socket, _Handler)
+    server.model = model
+    print(f"[whisper-server] Listening on {args.socket}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.exists(args.socket):
+            os.unlink(args.socket)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())